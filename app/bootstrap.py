@@ -0,0 +1,43 @@
+"""
+One-time startup work for Campus Access Management System.
+
+Migrations run once per process tree: when serving with several workers,
+``main.py`` calls ``preload()`` in the parent process before the workers
+are started, and the workers inherit a flag through the environment so
+their own startup skips the migrations.
+"""
+
+import logging
+import os
+
+from app.database.migrations import run_migrations, initialize_sample_data
+
+logger = logging.getLogger(__name__)
+
+# Set once migrations have succeeded; inherited by worker processes
+_PRELOADED_ENV = "CAMPUS_MIGRATIONS_DONE"
+
+def preload():
+    """
+    Run database migrations and check sample data, unless a parent process
+    has already done so.
+
+    Returns:
+        bool: True if the database is ready, False if migrations failed
+    """
+    if os.environ.get(_PRELOADED_ENV) == "1":
+        logger.info("Database migrations already run, skipping")
+        return True
+
+    logger.info("Running database migrations...")
+    if not run_migrations():
+        logger.error("Database migrations failed. Application may not function correctly.")
+        # Note: We don't exit here to allow the app to start even if migrations fail
+        # This is useful for development and testing scenarios
+        return False
+
+    logger.info("Database migrations completed successfully")
+    # Check sample data
+    initialize_sample_data()
+    os.environ[_PRELOADED_ENV] = "1"
+    return True
@@ -1,93 +1,165 @@
 """
 Application settings and configuration for Campus Access Management System.
 Uses python-dotenv for environment variable management.
+
+Settings are built lazily on first access and cached for the lifetime of the
+process. The legacy module-level names (``DATABASE_URL``, ``APP_NAME``, ...)
+and the ``settings`` object remain importable and resolve through
+``get_settings()``.
 """
 
 import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import orjson
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
-
-# Database Configuration
-DB_HOST = os.getenv("DB_HOST", "localhost")
-DB_PORT = int(os.getenv("DB_PORT", "3306"))
-DB_NAME = os.getenv("DB_NAME", "campus_access_db")
-DB_USER = os.getenv("DB_USER", "campus_user")
-DB_PASSWORD = os.getenv("DB_PASSWORD", "campus_password")
-
-# Construct database URL
-DATABASE_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-
-# Security Configuration
-SECRET_KEY = os.getenv("SECRET_KEY", "hackaton-estiam-2025-secret")
-ALGORITHM = os.getenv("ALGORITHM", "HS256")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
-
-# Server Configuration
-HOST = os.getenv("HOST", "0.0.0.0")
-PORT = int(os.getenv("PORT", "8000"))
-DEBUG = os.getenv("DEBUG", "false").lower() == "true"
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-
-# Application Settings
-APP_NAME = os.getenv("APP_NAME", "Campus Access Management System")
-APP_VERSION = os.getenv("APP_VERSION", "1.0.0")
-
-# CORS Configuration
-CORS_ORIGINS = os.getenv("CORS_ORIGINS", "['*']").replace("'", '"')
-CORS_ALLOW_CREDENTIALS = os.getenv("CORS_ALLOW_CREDENTIALS", "true").lower() == "true"
-CORS_ALLOW_METHODS = os.getenv("CORS_ALLOW_METHODS", "['*']").replace("'", '"')
-CORS_ALLOW_HEADERS = os.getenv("CORS_ALLOW_HEADERS", "['*']").replace("'", '"')
-
-# Import json for parsing CORS settings
-import json
-
-# Parse CORS settings from strings to lists
-try:
-    CORS_ORIGINS = json.loads(CORS_ORIGINS)
-except json.JSONDecodeError:
-    CORS_ORIGINS = ["*"]
-
-try:
-    CORS_ALLOW_METHODS = json.loads(CORS_ALLOW_METHODS)
-except json.JSONDecodeError:
-    CORS_ALLOW_METHODS = ["*"]
-
-try:
-    CORS_ALLOW_HEADERS = json.loads(CORS_ALLOW_HEADERS)
-except json.JSONDecodeError:
-    CORS_ALLOW_HEADERS = ["*"]
-
-# Create global settings instance
-settings = {
-    "app_name": APP_NAME,
-    "app_version": APP_VERSION,
-    "debug": DEBUG,
-    "host": HOST,
-    "port": PORT,
-    "cors_origins": CORS_ORIGINS,
-    "cors_allow_credentials": CORS_ALLOW_CREDENTIALS,
-    "cors_allow_methods": CORS_ALLOW_METHODS,
-    "cors_allow_headers": CORS_ALLOW_HEADERS,
-    "database_url": DATABASE_URL,
-    "database_host": DB_HOST,
-    "database_port": DB_PORT,
-    "database_name": DB_NAME,
-    "database_user": DB_USER,
-    "database_password": DB_PASSWORD,
-    "secret_key": SECRET_KEY,
-    "algorithm": ALGORITHM,
-    "access_token_expire_minutes": ACCESS_TOKEN_EXPIRE_MINUTES,
-    "log_level": LOG_LEVEL
-}
+# Matches the default "['*']" / '["*"]' so the common case skips JSON parsing
+_WILDCARD_LIST = re.compile(r"""^\[\s*['"]\*['"]\s*\]$""")
+_WILDCARD = ("*",)
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Immutable application settings."""
+    app_name: str
+    app_version: str
+    environment: str
+    debug: bool
+    host: str
+    port: int
+    workers: int
+    access_log: bool
+    limit_concurrency: Optional[int]
+    backlog: int
+    cors_origins: Tuple[str, ...]
+    cors_allow_credentials: bool
+    cors_allow_methods: Tuple[str, ...]
+    cors_allow_headers: Tuple[str, ...]
+    cors_max_age: int
+    database_url: str
+    async_database_url: str
+    database_host: str
+    database_port: int
+    database_name: str
+    database_user: str
+    database_password: str
+    db_pool_size: int
+    db_max_overflow: int
+    db_pool_timeout: int
+    db_pool_recycle: int
+    db_connect_timeout: int
+    db_pool_pre_ping: bool
+    db_pool_warm_size: int
+    secret_key: str
+    algorithm: str
+    access_token_expire_minutes: int
+    bcrypt_rounds: int
+    admin_password_hash: Optional[str]
+    log_level: str
 
-# Environment-specific settings
-def get_settings():
+
+def _parse_list(raw: str) -> Tuple[str, ...]:
+    """Parse a JSON-style list from an environment variable, defaulting to ('*',)."""
+    if _WILDCARD_LIST.match(raw):
+        return _WILDCARD
+    try:
+        return tuple(orjson.loads(raw.replace("'", '"')))
+    except orjson.JSONDecodeError:
+        return _WILDCARD
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
     """
     Get application settings based on environment.
-    
+
+    The .env file is loaded and parsed on the first call only.
+
     Returns:
         Settings instance configured for current environment
     """
-    return settings 
\ No newline at end of file
+    # Load environment variables from .env file
+    load_dotenv()
+
+    # Database Configuration
+    db_host = os.getenv("DB_HOST", "localhost")
+    db_port = int(os.getenv("DB_PORT", "3306"))
+    db_name = os.getenv("DB_NAME", "campus_access_db")
+    db_user = os.getenv("DB_USER", "campus_user")
+    db_password = os.getenv("DB_PASSWORD", "campus_password")
+
+    return Settings(
+        # Application Settings
+        app_name=os.getenv("APP_NAME", "Campus Access Management System"),
+        app_version=os.getenv("APP_VERSION", "1.0.0"),
+        environment=os.getenv("ENV", "dev"),
+        # Server Configuration
+        debug=os.getenv("DEBUG", "false").lower() == "true",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        # Worker processes; in-process caches are per worker, token revocations
+        # live in the database and apply to all of them
+        workers=int(os.getenv("WORKERS", "1")),
+        access_log=os.getenv("ACCESS_LOG", "false").lower() == "true",
+        # Per-worker cap on in-flight connections/tasks before answering 503 (0 disables)
+        limit_concurrency=int(os.getenv("LIMIT_CONCURRENCY", "100")) or None,
+        backlog=int(os.getenv("BACKLOG", "2048")),
+        log_level=os.getenv("LOG_LEVEL", "INFO"),
+        # CORS Configuration
+        cors_origins=_parse_list(os.getenv("CORS_ORIGINS", "['*']")),
+        cors_allow_credentials=os.getenv("CORS_ALLOW_CREDENTIALS", "true").lower() == "true",
+        cors_allow_methods=_parse_list(os.getenv("CORS_ALLOW_METHODS", "['*']")),
+        cors_allow_headers=_parse_list(os.getenv("CORS_ALLOW_HEADERS", "['*']")),
+        # Seconds browsers may cache a preflight response
+        cors_max_age=int(os.getenv("CORS_MAX_AGE", "86400")),
+        # Database Configuration
+        database_url=f"mysql+pymysql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}",
+        async_database_url=f"mysql+aiomysql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}",
+        database_host=db_host,
+        database_port=db_port,
+        database_name=db_name,
+        database_user=db_user,
+        database_password=db_password,
+        # Connection pool configuration
+        db_pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+        db_max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "40")),
+        db_pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "5")),
+        db_pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        db_connect_timeout=int(os.getenv("DB_CONNECT_TIMEOUT", "5")),
+        db_pool_pre_ping=os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+        # Connections opened at startup so early requests skip the handshake
+        db_pool_warm_size=int(os.getenv("DB_POOL_WARM_SIZE", os.getenv("DB_POOL_SIZE", "20"))),
+        # Security Configuration
+        secret_key=os.getenv("SECRET_KEY", "hackaton-estiam-2025-secret"),
+        algorithm=os.getenv("ALGORITHM", "HS256"),
+        access_token_expire_minutes=int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60")),
+        # bcrypt cost factor for new password hashes
+        bcrypt_rounds=int(os.getenv("BCRYPT_ROUNDS", "10")),
+        # Precomputed bcrypt hash for the seeded admin account (optional)
+        admin_password_hash=os.getenv("ADMIN_PASSWORD_HASH") or None,
+    )
+
+
+# Legacy module-level names whose Settings field is not simply name.lower()
+_FIELD_ALIASES = {
+    "DB_HOST": "database_host",
+    "DB_PORT": "database_port",
+    "DB_NAME": "database_name",
+    "DB_USER": "database_user",
+    "DB_PASSWORD": "database_password",
+}
+
+
+def __getattr__(name):
+    """Resolve legacy module-level settings names lazily."""
+    if name == "settings":
+        return get_settings()
+    if name.isupper():
+        field = _FIELD_ALIASES.get(name, name.lower())
+        if field in Settings.__dataclass_fields__:
+            return getattr(get_settings(), field)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,7 @@
 Database package for Campus Access Management System.
 """
 
-from .init_db import engine, SessionLocal, Base, init_database
+from app.models.base import engine, SessionLocal, async_engine, AsyncSessionLocal, Base
+from .init_db import init_database
 
-__all__ = ["engine", "SessionLocal", "Base", "init_database"]
+__all__ = ["engine", "SessionLocal", "async_engine", "AsyncSessionLocal", "Base", "init_database"]
@@ -3,22 +3,53 @@ Database initialization script for Campus Access Management System.
 Creates all tables and inserts default data.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from app.models.base import Base
-from app.models.database_models import Role, User
-from app.config.settings import settings
-import bcrypt
+import logging
 
-# —– Configuration du moteur et de la session au niveau module —–
-engine = create_engine(settings["database_url"], pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+from app.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# bcrypt cost for the seeded admin password; full cost only in production
+SEED_BCRYPT_ROUNDS_PROD = 12
+SEED_BCRYPT_ROUNDS_DEV = 10
+
+
+def _admin_password_hash():
+    """
+    Return the bcrypt hash for the seeded admin account.
+
+    Only runs when the admin user is missing. Deployments that want to skip
+    the bcrypt work at boot set ADMIN_PASSWORD_HASH instead.
+
+    Returns:
+        str: ADMIN_PASSWORD_HASH if set, otherwise a fresh hash of the
+        default password at the cost for this environment
+    """
+    if get_settings().admin_password_hash:
+        return get_settings().admin_password_hash
+
+    import bcrypt
+
+    if get_settings().environment == "prod":
+        rounds = SEED_BCRYPT_ROUNDS_PROD
+    else:
+        rounds = SEED_BCRYPT_ROUNDS_DEV
+    return bcrypt.hashpw(
+        "admin123".encode('utf-8'),
+        bcrypt.gensalt(rounds=rounds)
+    ).decode('utf-8')
 
 
 def init_database():
     """
     Initialize the database by creating all tables and inserting default data.
     """
+    # Imported here so that re-exporting init_database stays cheap
+    from sqlalchemy import exists, select
+
+    from app.models.base import engine, SessionLocal, Base
+    from app.models.database_models import Role, User
+
     # Création de toutes les tables
     Base.metadata.create_all(bind=engine)
 
@@ -26,40 +57,37 @@ def init_database():
     db = SessionLocal()
     try:
         # Vérifier et insérer les rôles par défaut
-        if db.query(Role).count() == 0:
+        if not db.scalar(select(exists().select_from(Role))):
             default_roles = [
                 Role(name="admin"),
                 Role(name="student"),
                 Role(name="professor")
             ]
             db.add_all(default_roles)
-            db.commit()
-            print("Default roles created successfully")
+            logger.info("Default roles created successfully")
         else:
-            print("Default roles already exist")
+            logger.info("Default roles already exist")
 
         # Vérifier et créer l'utilisateur admin
-        if not db.query(User).filter(User.email == "admin@campus.com").first():
-            hashed_password = bcrypt.hashpw(
-                "admin123".encode('utf-8'),
-                bcrypt.gensalt()
-            ).decode('utf-8')
+        if db.scalar(select(User.id).where(User.email == "admin@campus.com")) is None:
+            hashed_password = _admin_password_hash()
             admin_user = User(
                 email="admin@campus.com",
                 password_hash=hashed_password,
                 role="admin"
             )
             db.add(admin_user)
-            db.commit()
-            db.refresh(admin_user)
-            print("Admin user created successfully")
+            logger.info("Admin user created successfully")
         else:
-            print("Admin user already exists")
+            logger.info("Admin user already exists")
+
+        # Roles and admin are flushed together in one transaction
+        db.commit()
 
-        print("Database initialization completed successfully")
+        logger.info("Database initialization completed successfully")
 
     except Exception as e:
-        print(f"Error during database initialization: {e}")
+        logger.error("Error during database initialization: %s", e)
         db.rollback()
     finally:
         db.close()
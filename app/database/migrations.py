@@ -4,12 +4,37 @@ Handles table creation and schema updates on application startup.
 """
 
 import logging
+from functools import lru_cache
 from sqlalchemy import text, inspect
 from sqlalchemy.exc import OperationalError
 from app.models.base import engine, Base
 
 logger = logging.getLogger(__name__)
 
+# Tables managed by the application
+REQUIRED_TABLES = frozenset({
+    'users', 'access_cards', 'rooms', 'access_logs',
+    'room_reservations', 'students', 'professors', 'roles', 'user_roles',
+    'revoked_tokens'
+})
+
+# Prebuilt statements per known table; table names are never interpolated
+# from caller input.
+_COUNT_STMTS = {name: text(f"SELECT COUNT(*) FROM {name}") for name in REQUIRED_TABLES}
+_HAS_ROWS_STMTS = {name: text(f"SELECT 1 FROM {name} LIMIT 1") for name in REQUIRED_TABLES}
+
+def _table_stmt(statements, table_name):
+    """
+    Look up the prebuilt statement for a table.
+    
+    Raises:
+        ValueError: If the table is not one of REQUIRED_TABLES
+    """
+    stmt = statements.get(table_name)
+    if stmt is None:
+        raise ValueError(f"Unknown table: {table_name}")
+    return stmt
+
 def check_database_connection():
     """
     Check if database connection is available.
@@ -29,16 +54,31 @@ def check_database_connection():
         logger.error(f"Unexpected error during database connection: {e}")
         return False
 
-def get_existing_tables():
+# Table names cached for the process lifetime, with no expiry or background
+# refresh. create_all_tables() refreshes it after its own DDL; tables created
+# any other way are only seen by callers passing force=True, as
+# run_migrations() does and the readiness probe does on a miss.
+_TABLES_CACHE = None
+
+def get_existing_tables(force=False):
     """
     Get list of existing tables in the database.
+    The result is cached for the process lifetime after the first
+    successful lookup; only force=True queries the database again.
+    
+    Args:
+        force (bool): Bypass the cache and query the database again
     
     Returns:
         list: List of table names
     """
+    global _TABLES_CACHE
+    if not force and _TABLES_CACHE is not None:
+        return list(_TABLES_CACHE)
     try:
         inspector = inspect(engine)
-        return inspector.get_table_names()
+        _TABLES_CACHE = tuple(inspector.get_table_names())
+        return list(_TABLES_CACHE)
     except Exception as e:
         logger.error(f"Error getting existing tables: {e}")
         return []
@@ -53,6 +93,7 @@ def create_all_tables():
     try:
         logger.info("Creating database tables...")
         Base.metadata.create_all(bind=engine)
+        get_existing_tables(force=True)
         logger.info("All tables created successfully")
         return True
     except Exception as e:
@@ -72,12 +113,17 @@ def run_migrations():
             logger.error("Cannot run migrations: Database connection failed")
             return False
         
-        # Get existing tables
-        existing_tables = get_existing_tables()
+        # Get existing tables, fresh from the database since the result
+        # decides whether any DDL runs
+        existing_tables = get_existing_tables(force=True)
         logger.info(f"Existing tables: {existing_tables}")
         
+        # create_all only ever adds missing tables, so when every model table
+        # already exists there is nothing to do and its per-table checks are skipped
+        if Base.metadata.tables.keys() <= set(existing_tables):
+            logger.info("Schema up to date, no tables to create")
         # Create all tables (SQLAlchemy will handle IF NOT EXISTS)
-        if not create_all_tables():
+        elif not create_all_tables():
             logger.error("Failed to create tables")
             return False
         
@@ -86,12 +132,7 @@ def run_migrations():
         logger.info(f"Final tables: {final_tables}")
         
         # Check if all required tables exist
-        required_tables = [
-            'users', 'access_cards', 'rooms', 'access_logs', 
-            'room_reservations', 'students', 'professors', 'roles', 'user_roles'
-        ]
-        
-        missing_tables = [table for table in required_tables if table not in final_tables]
+        missing_tables = sorted(REQUIRED_TABLES.difference(final_tables))
         if missing_tables:
             logger.error(f"Missing required tables: {missing_tables}")
             return False
@@ -112,10 +153,14 @@ def check_table_data(table_name):
         
     Returns:
         int: Number of rows in the table
+        
+    Raises:
+        ValueError: If the table is not one of REQUIRED_TABLES
     """
+    stmt = _table_stmt(_COUNT_STMTS, table_name)
     try:
         with engine.connect() as connection:
-            result = connection.execute(text(f"SELECT COUNT(*) FROM {table_name}"))
+            result = connection.execute(stmt)
             count = result.scalar()
             logger.info(f"Table {table_name} has {count} rows")
             return count
@@ -123,6 +168,64 @@ def check_table_data(table_name):
         logger.error(f"Error checking data in table {table_name}: {e}")
         return 0
 
+@lru_cache(maxsize=32)
+def _count_tables_stmt(table_names):
+    """Build one SELECT returning a row count per table, labelled by table name."""
+    return text("SELECT " + ", ".join(
+        f"(SELECT COUNT(*) FROM {name}) AS {name}" for name in table_names
+    ))
+
+def check_tables_data(table_names):
+    """
+    Count the rows of several tables in a single round trip.
+    
+    Args:
+        table_names (iterable): Names of the tables to count
+        
+    Returns:
+        dict: Row count per table name (0 for every table on error)
+        
+    Raises:
+        ValueError: If a table is not one of REQUIRED_TABLES
+    """
+    table_names = tuple(sorted(set(table_names)))
+    unknown = [name for name in table_names if name not in REQUIRED_TABLES]
+    if unknown:
+        raise ValueError(f"Unknown table: {unknown[0]}")
+    if not table_names:
+        return {}
+    try:
+        with engine.connect() as connection:
+            counts = connection.execute(_count_tables_stmt(table_names)).one()._asdict()
+            logger.info(f"Table row counts: {counts}")
+            return counts
+    except Exception as e:
+        logger.error(f"Error checking data in tables {list(table_names)}: {e}")
+        return dict.fromkeys(table_names, 0)
+
+def table_has_data(table_name):
+    """
+    Check whether a table contains at least one row.
+    Cheaper than check_table_data when only emptiness matters.
+    
+    Args:
+        table_name (str): Name of the table to check
+        
+    Returns:
+        bool: True if the table has rows, False otherwise
+        
+    Raises:
+        ValueError: If the table is not one of REQUIRED_TABLES
+    """
+    stmt = _table_stmt(_HAS_ROWS_STMTS, table_name)
+    try:
+        with engine.connect() as connection:
+            result = connection.execute(stmt)
+            return result.first() is not None
+    except Exception as e:
+        logger.error(f"Error checking data in table {table_name}: {e}")
+        return False
+
 def initialize_sample_data():
     """
     Initialize sample data if tables are empty.
@@ -130,11 +233,10 @@ def initialize_sample_data():
     """
     try:
         # Check if users table has data
-        user_count = check_table_data('users')
-        if user_count == 0:
+        if not table_has_data('users'):
             logger.info("Tables appear to be empty. Sample data should be loaded from database_setup.sql")
         else:
-            logger.info(f"Database already contains {user_count} users")
+            logger.info("Database already contains users")
         
         return True
     except Exception as e:
@@ -2,15 +2,15 @@
 Models package for Campus Access Management System.
 """
 
-from .base import Base, SQLAlchemyBaseModel, get_db
+from .base import Base, SQLAlchemyBaseModel, get_db, get_async_db
 from .database_models import (
     User, Role, UserRole, AccessCard, AccessLog, 
     Room, RoomReservation, Student, Professor,
-    UserRole as UserRoleEnum, CardStatus, AccessType
+    CardStatus, AccessType
 )
 from .schemas import (
     # User schemas
-    UserCreate, UserUpdate, UserResponse,
+    UserCreate, UserUpdate, UserPasswordUpdate, UserResponse,
     # Access card schemas
     AccessCardCreate, AccessCardUpdate, AccessCardResponse,
     # Access log schemas
@@ -25,15 +25,23 @@ from .schemas import (
     ProfessorCreate, ProfessorUpdate, ProfessorResponse,
     # Authentication schemas
     LoginRequest, LoginResponse, ExtendedLoginResponse, TokenResponse,
+    StudentProfile, ProfessorProfile, AdminProfile, UserProfile,
     # Common schemas
-    PaginationParams, PaginatedResponse, ErrorResponse,
+    PaginationParams, PaginatedResponse, CursorPage, ErrorResponse,
     # Enums
-    UserRoleEnum, CardStatusEnum, AccessTypeEnum
+    UserRoleEnum, CardStatusEnum, AccessTypeEnum,
+    # List adapters
+    USER_LIST_ADAPTER, ACCESS_CARD_LIST_ADAPTER, ACCESS_LOG_LIST_ADAPTER,
+    ROOM_LIST_ADAPTER, RESERVATION_LIST_ADAPTER, EXTENDED_RESERVATION_LIST_ADAPTER,
+    STUDENT_LIST_ADAPTER, PROFESSOR_LIST_ADAPTER, ACCESS_LOG_PAGE_ADAPTER,
+    USER_PAGE_ADAPTER, STUDENT_PAGE_ADAPTER, PROFESSOR_PAGE_ADAPTER, ACCESS_CARD_PAGE_ADAPTER,
+    ROOM_PAGE_ADAPTER, RESERVATION_PAGE_ADAPTER, EXTENDED_RESERVATION_PAGE_ADAPTER,
+    dump_json, dump_constructed
 )
 
 __all__ = [
     # Base models
-    "Base", "SQLAlchemyBaseModel", "get_db",
+    "Base", "SQLAlchemyBaseModel", "get_db", "get_async_db",
     
     # Database models
     "User", "Role", "UserRole", "AccessCard", "AccessLog",
@@ -41,7 +49,7 @@ __all__ = [
     "UserRoleEnum", "CardStatus", "AccessType",
     
     # User schemas
-    "UserCreate", "UserUpdate", "UserResponse",
+    "UserCreate", "UserUpdate", "UserPasswordUpdate", "UserResponse",
     
     # Access card schemas
     "AccessCardCreate", "AccessCardUpdate", "AccessCardResponse",
@@ -63,10 +71,19 @@ __all__ = [
     
     # Authentication schemas
     "LoginRequest", "LoginResponse", "ExtendedLoginResponse", "TokenResponse",
+    "StudentProfile", "ProfessorProfile", "AdminProfile", "UserProfile",
     
     # Common schemas
-    "PaginationParams", "PaginatedResponse", "ErrorResponse",
+    "PaginationParams", "PaginatedResponse", "CursorPage", "ErrorResponse",
     
     # Enums
-    "UserRoleEnum", "CardStatusEnum", "AccessTypeEnum"
+    "UserRoleEnum", "CardStatusEnum", "AccessTypeEnum",
+    
+    # List adapters
+    "USER_LIST_ADAPTER", "ACCESS_CARD_LIST_ADAPTER", "ACCESS_LOG_LIST_ADAPTER",
+    "ROOM_LIST_ADAPTER", "RESERVATION_LIST_ADAPTER", "EXTENDED_RESERVATION_LIST_ADAPTER",
+    "STUDENT_LIST_ADAPTER", "PROFESSOR_LIST_ADAPTER", "ACCESS_LOG_PAGE_ADAPTER",
+    "USER_PAGE_ADAPTER", "STUDENT_PAGE_ADAPTER", "PROFESSOR_PAGE_ADAPTER", "ACCESS_CARD_PAGE_ADAPTER",
+    "ROOM_PAGE_ADAPTER", "RESERVATION_PAGE_ADAPTER", "EXTENDED_RESERVATION_PAGE_ADAPTER",
+    "dump_json", "dump_constructed"
 ] 
\ No newline at end of file
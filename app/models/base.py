@@ -3,20 +3,58 @@ Base models and common database configurations.
 Contains shared model functionality and database utilities.
 """
 
-from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field, ConfigDict
-from sqlalchemy import create_engine, Column, String, DateTime, Text
+from sqlalchemy import create_engine, select, text, Column
+from sqlalchemy.types import BINARY, TypeDecorator
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.sql import func
+import asyncio
+import logging
 import uuid
-from app.config.settings import DATABASE_URL
+from datetime import datetime, timezone
+from app.config.settings import (
+    DATABASE_URL, ASYNC_DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_CONNECT_TIMEOUT, DB_POOL_PRE_PING
+)
+
+logger = logging.getLogger(__name__)
+
+# Compiled-statement cache entries per engine (SQLAlchemy default is 500)
+QUERY_CACHE_SIZE = 1200
 
 # Database engine and session
-engine = create_engine(DATABASE_URL)
+# Pool is sized explicitly; LIFO checkout keeps a small set of connections warm
+# and recycling avoids MySQL dropping idle connections (wait_timeout).
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+    pool_use_lifo=True,
+    connect_args={"connect_timeout": DB_CONNECT_TIMEOUT},
+    query_cache_size=QUERY_CACHE_SIZE,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine and session for request handlers (aiomysql driver).
+# Objects are not expired on commit, so returning them after a commit does
+# not trigger another SELECT.
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+    pool_use_lifo=True,
+    connect_args={"connect_timeout": DB_CONNECT_TIMEOUT},
+    query_cache_size=QUERY_CACHE_SIZE,
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
 # Base class for all SQLAlchemy models
 Base = declarative_base()
 
@@ -31,40 +69,140 @@ def get_db():
     finally:
         db.close()
 
-class SQLAlchemyBaseModel(Base):
+async def get_async_db():
     """
-    Abstract base model with common fields for SQLAlchemy models.
+    Async database dependency for FastAPI.
+    Yields an AsyncSession that is closed when the request finishes.
     """
-    __abstract__ = True
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def warm_connection_pool(size):
+    """
+    Open up to ``size`` async pool connections concurrently, so the first
+    requests after startup do not each pay for the MySQL handshake.
+    Failures are logged and never abort startup.
     
-    # Common fields for all models
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    Args:
+        size: Number of connections to open (capped at the pool size)
+        
+    Returns:
+        int: Number of connections successfully opened
+    """
+    async def ping():
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    
+    results = await asyncio.gather(
+        *(ping() for _ in range(min(size, DB_POOL_SIZE))), return_exceptions=True
+    )
+    warmed = sum(1 for result in results if not isinstance(result, BaseException))
+    if warmed < len(results):
+        errors = [result for result in results if isinstance(result, BaseException)]
+        logger.warning(f"Connection pool warm-up: {warmed}/{len(results)} connections opened ({errors[0]})")
+    else:
+        logger.info(f"Connection pool warmed with {warmed} connections")
+    return warmed
 
-class BaseResponseModel(BaseModel):
+async def paginate(db, stmt, skip, limit, params=None, scalars=False):
     """
-    Base response model with common configuration.
-    All response models should inherit from this.
+    Fetch one offset page of a select statement and its total row count.
+    
+    Args:
+        db: Async database session
+        stmt: Ordered select statement for the full result
+        skip: Number of rows to skip
+        limit: Maximum number of rows to return
+        params: Values for the statement's bound parameters, if any
+        scalars: Return the first column of each row, for statements
+            selecting a single ORM entity
+        
+    Returns:
+        Dictionary matching PaginatedResponse (items, total, skip, limit)
     """
-    model_config = ConfigDict(
-        from_attributes=True,
-        json_encoders={
-            datetime: lambda v: v.isoformat()
-        }
+    total = await db.scalar(
+        select(func.count()).select_from(stmt.order_by(None).subquery()), params
     )
+    # Past the last row there is nothing to fetch
+    items = []
+    if total > skip:
+        result = await db.execute(stmt.limit(limit).offset(skip), params)
+        items = (result.scalars() if scalars else result).all()
+    return {"items": items, "total": total, "skip": skip, "limit": limit}
 
-class PaginationParams(BaseModel):
+def violated_column(error, columns):
     """
-    Common pagination parameters.
+    Find which unique column an IntegrityError was raised for.
+    
+    Args:
+        error: IntegrityError raised by a flush or commit
+        columns: Candidate column names, checked in order
+        
+    Returns:
+        The first column named in the violated key, or None
     """
-    skip: int = Field(default=0, ge=0, description="Number of items to skip")
-    limit: int = Field(default=100, ge=1, le=1000, description="Maximum number of items to return")
+    message = str(error.orig)
+    # MySQL: "Duplicate entry 'x' for key 'students.email'"
+    # SQLite: "UNIQUE constraint failed: students.email"
+    key = message.rpartition(" for key ")[2]
+    for column in columns:
+        if column in key:
+            return column
+    return None
 
-class PaginatedResponse(BaseResponseModel):
+def is_foreign_key_violation(error):
     """
-    Generic paginated response wrapper.
+    Tell whether an IntegrityError was raised by a foreign key constraint.
+    
+    Args:
+        error: IntegrityError raised by a flush or commit
+        
+    Returns:
+        True if a referenced row is missing, False for other violations
     """
-    items: list
-    total: int
-    skip: int
-    limit: int
-    has_more: bool 
\ No newline at end of file
+    # MySQL: "Cannot add or update a child row: a foreign key constraint fails (...)"
+    # SQLite: "FOREIGN KEY constraint failed"
+    return "foreign key constraint" in str(error.orig).lower()
+
+def utcnow():
+    """
+    Current time as a naive UTC datetime, the form timestamps are stored in.
+    
+    Returns:
+        datetime: UTC now without tzinfo
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+class UUIDBinary(TypeDecorator):
+    """
+    UUID stored as BINARY(16) in the database.
+    The application keeps working with canonical UUID strings; conversion
+    happens when binding parameters and loading rows.
+    """
+    impl = BINARY(16)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, bytes):
+            return value
+        if isinstance(value, uuid.UUID):
+            return value.bytes
+        try:
+            return uuid.UUID(value).bytes
+        except (AttributeError, ValueError):
+            # Malformed IDs can never match a stored 16-byte key
+            return b""
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return str(uuid.UUID(bytes=value))
+
+class SQLAlchemyBaseModel(Base):
+    """
+    Abstract base model with common fields for SQLAlchemy models.
+    """
+    __abstract__ = True
+    
+    # Common fields for all models
+    id = Column(UUIDBinary, primary_key=True, default=lambda: str(uuid.uuid4()))
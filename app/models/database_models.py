@@ -3,10 +3,9 @@ Database models for Campus Access Management System.
 Based on the provided SQL schema.
 """
 
-from sqlalchemy import Column, String, Integer, DateTime, Enum, ForeignKey, CheckConstraint
+from sqlalchemy import Column, String, Integer, DateTime, Enum, ForeignKey, CheckConstraint, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-from app.models.base import SQLAlchemyBaseModel
+from app.models.base import SQLAlchemyBaseModel, UUIDBinary, utcnow
 import enum
 
 # Enum classes for status fields
@@ -39,12 +38,13 @@ class User(SQLAlchemyBaseModel):
     password_hash = Column(String(255), nullable=False)
     role = Column(Enum(UserRole), nullable=False)
     
-    # Relationships
-    access_cards = relationship("AccessCard", back_populates="user", cascade="all, delete-orphan")
-    room_reservations = relationship("RoomReservation", back_populates="reserved_by_user", cascade="all, delete-orphan")
-    student_profile = relationship("Student", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    professor_profile = relationship("Professor", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    user_roles = relationship("UserRole", back_populates="user", cascade="all, delete-orphan")
+    # Relationships; dependents are removed by the ON DELETE clauses in the
+    # schema (passive_deletes), so deleting a user never loads them first
+    access_cards = relationship("AccessCard", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    room_reservations = relationship("RoomReservation", back_populates="reserved_by_user", cascade="all, delete-orphan", passive_deletes=True)
+    student_profile = relationship("Student", back_populates="user", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    professor_profile = relationship("Professor", back_populates="user", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    user_roles = relationship("UserRole", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
 
 class Role(SQLAlchemyBaseModel):
     """
@@ -56,7 +56,7 @@ class Role(SQLAlchemyBaseModel):
     name = Column(String(50), unique=True, nullable=False)
     
     # Relationships
-    user_roles = relationship("UserRole", back_populates="role", cascade="all, delete-orphan")
+    user_roles = relationship("UserRole", back_populates="role", cascade="all, delete-orphan", passive_deletes=True)
 
 class UserRole(SQLAlchemyBaseModel):
     """
@@ -65,8 +65,8 @@ class UserRole(SQLAlchemyBaseModel):
     __tablename__ = "user_roles"
     
     # Foreign keys
-    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    role_id = Column(String(36), ForeignKey("roles.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(UUIDBinary, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    role_id = Column(UUIDBinary, ForeignKey("roles.id", ondelete="CASCADE"), nullable=False)
     
     # Relationships
     user = relationship("User", back_populates="user_roles")
@@ -79,14 +79,18 @@ class AccessCard(SQLAlchemyBaseModel):
     __tablename__ = "access_cards"
     
     # Card fields
-    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(UUIDBinary, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     card_number = Column(String(50), unique=True, nullable=False, index=True)
     status = Column(Enum(CardStatus), default=CardStatus.active)
-    issued_at = Column(DateTime, default=func.now())
+    # Set client-side (naive UTC, like every stored timestamp) so a new card
+    # can be returned without a refresh round-trip
+    issued_at = Column(DateTime, default=utcnow)
     
     # Relationships
     user = relationship("User", back_populates="access_cards")
-    access_logs = relationship("AccessLog", back_populates="card", cascade="all, delete-orphan")
+    # access_logs.card_id is ON DELETE SET NULL; the access cards and users
+    # routers delete a card's logs explicitly before the card
+    access_logs = relationship("AccessLog", back_populates="card", cascade="all, delete-orphan", passive_deletes=True)
 
 class AccessLog(SQLAlchemyBaseModel):
     """
@@ -95,11 +99,20 @@ class AccessLog(SQLAlchemyBaseModel):
     __tablename__ = "access_logs"
     
     # Log fields
-    card_id = Column(String(36), ForeignKey("access_cards.id", ondelete="SET NULL"), nullable=True)
-    accessed_at = Column(DateTime, default=func.now())
+    card_id = Column(UUIDBinary, ForeignKey("access_cards.id", ondelete="SET NULL"), nullable=True)
+    accessed_at = Column(DateTime, default=utcnow)
     location = Column(String(100), nullable=False)
     access_type = Column(Enum(AccessType), nullable=False)
     
+    # Time-ordered history (global, per card, per location) and a covering
+    # index for the stats aggregate
+    __table_args__ = (
+        Index('ix_access_logs_accessed_at', 'accessed_at'),
+        Index('ix_access_logs_card_accessed', 'card_id', 'accessed_at'),
+        Index('ix_access_logs_location_accessed', 'location', 'accessed_at'),
+        Index('ix_access_logs_card_location_type', 'card_id', 'location', 'access_type'),
+    )
+    
     # Relationships
     card = relationship("AccessCard", back_populates="access_logs")
 
@@ -120,7 +133,7 @@ class Room(SQLAlchemyBaseModel):
     )
     
     # Relationships
-    reservations = relationship("RoomReservation", back_populates="room", cascade="all, delete-orphan")
+    reservations = relationship("RoomReservation", back_populates="room", cascade="all, delete-orphan", passive_deletes=True)
 
 class RoomReservation(SQLAlchemyBaseModel):
     """
@@ -129,15 +142,17 @@ class RoomReservation(SQLAlchemyBaseModel):
     __tablename__ = "room_reservations"
     
     # Reservation fields
-    room_id = Column(String(36), ForeignKey("rooms.id", ondelete="CASCADE"), nullable=False)
-    reserved_by = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    room_id = Column(UUIDBinary, ForeignKey("rooms.id", ondelete="CASCADE"), nullable=False)
+    reserved_by = Column(UUIDBinary, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     start_time = Column(DateTime, nullable=False)
     end_time = Column(DateTime, nullable=False)
     expected_occupants = Column(Integer, nullable=False)
     
-    # Add check constraint for expected occupants
+    # Add check constraints and composite index for overlap lookups
     __table_args__ = (
         CheckConstraint('expected_occupants > 0', name='check_occupants_positive'),
+        CheckConstraint('end_time > start_time', name='check_end_after_start'),
+        Index('ix_room_reservations_room_time', 'room_id', 'start_time', 'end_time'),
     )
     
     # Relationships
@@ -151,13 +166,20 @@ class Student(SQLAlchemyBaseModel):
     __tablename__ = "students"
     
     # Student fields
-    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False)
+    user_id = Column(UUIDBinary, ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False)
     full_name = Column(String(100), nullable=False)
     student_card_id = Column(String(50), unique=True, nullable=False, index=True)
     email = Column(String(150), unique=True, nullable=False)
     class_name = Column(String(50), nullable=False)  # Using class_name to avoid Python keyword conflict
     phone_number = Column(String(20), nullable=True)
-    registered_at = Column(DateTime, default=func.now())
+    # Set client-side (naive UTC) so a freshly created profile can be
+    # returned without a refresh round-trip
+    registered_at = Column(DateTime, default=utcnow)
+    
+    # Class lookups and grouping; phone_number makes it covering for the stats
+    __table_args__ = (
+        Index('ix_students_class_phone', 'class_name', 'phone_number'),
+    )
     
     # Relationships
     user = relationship("User", back_populates="student_profile")
@@ -169,12 +191,31 @@ class Professor(SQLAlchemyBaseModel):
     __tablename__ = "professors"
     
     # Professor fields
-    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False)
+    user_id = Column(UUIDBinary, ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False)
     full_name = Column(String(100), nullable=False)
     email = Column(String(150), unique=True, nullable=False)
     department = Column(String(100), nullable=True)
     phone_number = Column(String(20), nullable=True)
     office = Column(String(100), nullable=True)
     
+    # Department lookups and grouping; phone_number and office make it
+    # covering for the stats
+    __table_args__ = (
+        Index('ix_professors_department_cover', 'department', 'phone_number', 'office'),
+    )
+    
     # Relationships
-    user = relationship("User", back_populates="professor_profile") 
\ No newline at end of file
+    user = relationship("User", back_populates="professor_profile")
+
+
+class RevokedToken(SQLAlchemyBaseModel):
+    """
+    Revoked tokens table - Access tokens invalidated through logout.
+    Kept in the database so every worker honours a revocation, and only
+    purged once the token has expired anyway.
+    """
+    __tablename__ = "revoked_tokens"
+    
+    # SHA-256 of the raw token; the token itself is never stored
+    token_hash = Column(String(64), unique=True, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
@@ -3,10 +3,25 @@ Pydantic schemas for Campus Access Management System API.
 These schemas define the structure of request and response data.
 """
 
-from pydantic import BaseModel, Field, EmailStr, validator
-from typing import Optional, List
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, TypeAdapter, ValidationInfo, WithJsonSchema, field_validator
+from pydantic.networks import validate_email
+from typing import Annotated, Generic, Literal, Optional, List, Type, TypeVar, Union
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+
+@lru_cache(maxsize=4096)
+def _validate_email_cached(value: str) -> str:
+    """Validate and normalize an email address, memoizing repeated values."""
+    return validate_email(value)[1]
+
+# Drop-in replacement for EmailStr. Response models re-validate the same
+# addresses read back from the database, so validation results are cached.
+CachedEmailStr = Annotated[
+    str,
+    AfterValidator(_validate_email_cached),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
 
 # Enum classes for API schemas
 class UserRoleEnum(str, Enum):
@@ -30,16 +45,12 @@ class AccessTypeEnum(str, Enum):
 # Base schemas
 class BaseSchema(BaseModel):
     """Base schema with common configuration."""
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(from_attributes=True)
 
 # User schemas
 class UserBase(BaseSchema):
     """Base user schema."""
-    email: EmailStr = Field(..., description="User email address")
+    email: CachedEmailStr = Field(..., description="User email address")
     role: UserRoleEnum = Field(..., description="User role")
 
 class UserCreate(UserBase):
@@ -48,11 +59,16 @@ class UserCreate(UserBase):
 
 class UserUpdate(BaseSchema):
     """Schema for updating a user."""
-    email: Optional[EmailStr] = Field(None, description="User email address")
+    email: Optional[CachedEmailStr] = Field(None, description="User email address")
     role: Optional[UserRoleEnum] = Field(None, description="User role")
 
+class UserPasswordUpdate(BaseSchema):
+    """Schema for changing a user's password."""
+    password: str = Field(..., min_length=8, description="New password (min 8 characters)")
+
 class UserResponse(UserBase):
     """Schema for user response."""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     id: str = Field(..., description="User ID")
 
 # Access Card schemas
@@ -124,10 +140,12 @@ class RoomReservationCreate(RoomReservationBase):
     """Schema for creating a new room reservation."""
     reserved_by: str = Field(..., description="User ID making the reservation")
 
-    @validator('end_time')
-    def end_time_must_be_after_start_time(cls, v, values):
+    @field_validator('end_time')
+    @classmethod
+    def end_time_must_be_after_start_time(cls, v: datetime, info: ValidationInfo) -> datetime:
         """Validate that end time is after start time."""
-        if 'start_time' in values and v <= values['start_time']:
+        start_time = info.data.get('start_time')
+        if start_time is not None and v <= start_time:
             raise ValueError('End time must be after start time')
         return v
 
@@ -153,7 +171,7 @@ class StudentBase(BaseSchema):
     """Base student schema."""
     full_name: str = Field(..., description="Student full name")
     student_card_id: str = Field(..., description="Student card ID")
-    email: EmailStr = Field(..., description="Student email")
+    email: CachedEmailStr = Field(..., description="Student email")
     class_name: str = Field(..., description="Student class")
     phone_number: Optional[str] = Field(None, description="Student phone number")
 
@@ -165,12 +183,13 @@ class StudentUpdate(BaseSchema):
     """Schema for updating a student."""
     full_name: Optional[str] = Field(None, description="Student full name")
     student_card_id: Optional[str] = Field(None, description="Student card ID")
-    email: Optional[EmailStr] = Field(None, description="Student email")
+    email: Optional[CachedEmailStr] = Field(None, description="Student email")
     class_name: Optional[str] = Field(None, description="Student class")
     phone_number: Optional[str] = Field(None, description="Student phone number")
 
 class StudentResponse(StudentBase):
     """Schema for student response."""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     id: str = Field(..., description="Student ID")
     user_id: str = Field(..., description="Associated user ID")
     registered_at: datetime = Field(..., description="Registration timestamp")
@@ -179,7 +198,7 @@ class StudentResponse(StudentBase):
 class ProfessorBase(BaseSchema):
     """Base professor schema."""
     full_name: str = Field(..., description="Professor full name")
-    email: EmailStr = Field(..., description="Professor email")
+    email: CachedEmailStr = Field(..., description="Professor email")
     department: Optional[str] = Field(None, description="Department")
     phone_number: Optional[str] = Field(None, description="Professor phone number")
     office: Optional[str] = Field(None, description="Office location")
@@ -191,13 +210,14 @@ class ProfessorCreate(ProfessorBase):
 class ProfessorUpdate(BaseSchema):
     """Schema for updating a professor."""
     full_name: Optional[str] = Field(None, description="Professor full name")
-    email: Optional[EmailStr] = Field(None, description="Professor email")
+    email: Optional[CachedEmailStr] = Field(None, description="Professor email")
     department: Optional[str] = Field(None, description="Department")
     phone_number: Optional[str] = Field(None, description="Professor phone number")
     office: Optional[str] = Field(None, description="Office location")
 
 class ProfessorResponse(ProfessorBase):
     """Schema for professor response."""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     id: str = Field(..., description="Professor ID")
     user_id: str = Field(..., description="Associated user ID")
 
@@ -214,13 +234,46 @@ class LoginResponse(BaseSchema):
     expires_in: int = Field(..., description="Token expiration time in minutes")
     user: UserResponse = Field(..., description="User information")
 
+class StudentProfile(BaseSchema):
+    """Student profile returned at login."""
+    type: Literal["student"] = "student"
+    id: str = Field(..., description="Student ID")
+    full_name: str = Field(..., description="Student full name")
+    student_card_id: str = Field(..., description="Student card ID")
+    email: str = Field(..., description="Student email")
+    class_name: str = Field(..., description="Student class")
+    phone_number: Optional[str] = Field(None, description="Phone number")
+    registered_at: Optional[datetime] = Field(None, description="Registration timestamp")
+
+class ProfessorProfile(BaseSchema):
+    """Professor profile returned at login."""
+    type: Literal["professor"] = "professor"
+    id: str = Field(..., description="Professor ID")
+    full_name: str = Field(..., description="Professor full name")
+    email: str = Field(..., description="Professor email")
+    department: Optional[str] = Field(None, description="Department")
+    phone_number: Optional[str] = Field(None, description="Phone number")
+    office: Optional[str] = Field(None, description="Office location")
+
+class AdminProfile(BaseSchema):
+    """Admin profile returned at login (admins have no profile table)."""
+    type: Literal["admin"] = "admin"
+    id: str = Field(..., description="User ID")
+    email: str = Field(..., description="User email")
+    role: str = Field(..., description="User role")
+
+UserProfile = Annotated[
+    Union[StudentProfile, ProfessorProfile, AdminProfile],
+    Field(discriminator="type"),
+]
+
 class ExtendedLoginResponse(BaseSchema):
     """Extended login response schema with token, user info, and full profile details."""
     access_token: str = Field(..., description="JWT access token")
     token_type: str = Field(..., description="Token type (bearer)")
     expires_in: int = Field(..., description="Token expiration time in minutes")
     user: UserResponse = Field(..., description="User information")
-    profile: Optional[dict] = Field(None, description="Full profile information (student, professor, or admin details)")
+    profile: Optional[UserProfile] = Field(None, description="Full profile information (student, professor, or admin details)")
 
 class TokenResponse(BaseModel):
     """Token response schema."""
@@ -233,15 +286,72 @@ class PaginationParams(BaseModel):
     skip: int = Field(0, ge=0, description="Number of records to skip")
     limit: int = Field(100, ge=1, le=1000, description="Number of records to return")
 
-class PaginatedResponse(BaseModel):
-    """Paginated response wrapper."""
-    items: List[BaseModel] = Field(..., description="List of items")
+T = TypeVar("T", bound=BaseModel)
+
+class PaginatedResponse(BaseModel, Generic[T]):
+    """Paginated response wrapper, parametrized as PaginatedResponse[ItemSchema]."""
+    items: List[T] = Field(..., description="List of items")
     total: int = Field(..., description="Total number of items")
     skip: int = Field(..., description="Number of records skipped")
     limit: int = Field(..., description="Number of records returned")
 
+class CursorPage(BaseModel, Generic[T]):
+    """Keyset-paginated response wrapper, parametrized as CursorPage[ItemSchema]."""
+    items: List[T] = Field(..., description="List of items")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
+    limit: int = Field(..., description="Maximum number of records per page")
+
 # Error schemas
 class ErrorResponse(BaseModel):
     """Error response schema."""
     error: str = Field(..., description="Error message")
-    detail: Optional[str] = Field(None, description="Detailed error information") 
\ No newline at end of file
+    detail: Optional[str] = Field(None, description="Detailed error information")
+
+# List adapters, built once at import and reused to validate/serialize
+# query results instead of constructing a TypeAdapter per request
+USER_LIST_ADAPTER = TypeAdapter(List[UserResponse])
+ACCESS_CARD_LIST_ADAPTER = TypeAdapter(List[AccessCardResponse])
+ACCESS_LOG_LIST_ADAPTER = TypeAdapter(List[AccessLogResponse])
+ROOM_LIST_ADAPTER = TypeAdapter(List[RoomResponse])
+RESERVATION_LIST_ADAPTER = TypeAdapter(List[RoomReservationResponse])
+EXTENDED_RESERVATION_LIST_ADAPTER = TypeAdapter(List[ExtendedRoomReservationResponse])
+STUDENT_LIST_ADAPTER = TypeAdapter(List[StudentResponse])
+PROFESSOR_LIST_ADAPTER = TypeAdapter(List[ProfessorResponse])
+ACCESS_LOG_PAGE_ADAPTER = TypeAdapter(CursorPage[AccessLogResponse])
+USER_PAGE_ADAPTER = TypeAdapter(PaginatedResponse[UserResponse])
+STUDENT_PAGE_ADAPTER = TypeAdapter(PaginatedResponse[StudentResponse])
+PROFESSOR_PAGE_ADAPTER = TypeAdapter(PaginatedResponse[ProfessorResponse])
+ACCESS_CARD_PAGE_ADAPTER = TypeAdapter(PaginatedResponse[AccessCardResponse])
+ROOM_PAGE_ADAPTER = TypeAdapter(PaginatedResponse[RoomResponse])
+RESERVATION_PAGE_ADAPTER = TypeAdapter(PaginatedResponse[RoomReservationResponse])
+EXTENDED_RESERVATION_PAGE_ADAPTER = TypeAdapter(PaginatedResponse[ExtendedRoomReservationResponse])
+
+def dump_json(adapter: TypeAdapter, data) -> bytes:
+    """
+    Validate query results against an adapter and serialize them to JSON in
+    a single pydantic-core pass.
+    
+    Args:
+        adapter: One of the prebuilt adapters above
+        data: ORM objects, rows or plain dicts/lists of them
+        
+    Returns:
+        JSON-encoded bytes
+    """
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+def dump_constructed(model_cls: Type[BaseModel], obj) -> bytes:
+    """
+    Serialize an ORM object the application has just written, building the
+    response model with model_construct instead of re-validating every field.
+    
+    Args:
+        model_cls: Response schema to serialize as
+        obj: ORM object exposing every field of the schema
+        
+    Returns:
+        JSON-encoded bytes
+    """
+    model = model_cls.model_construct(**{name: getattr(obj, name) for name in model_cls.model_fields})
+    # ORM enums are separate classes from the schema enums but share their values
+    return model.model_dump_json(warnings=False).encode()
@@ -1,23 +1,60 @@
 """
 Routers package for Campus Access Management System.
+
+Router modules are imported on first access, so importing the package (or
+a single router) does not pull in every other router's models and schemas.
+The legacy ``<module>_router`` names resolve to the module's ``router``.
+``register_routers()`` mounts them on the application.
 """
 
-from .health import router as health_router
-from .users import router as users_router
-from .access_cards import router as access_cards_router
-from .access_logs import router as access_logs_router
-from .rooms import router as rooms_router
-from .reservations import router as reservations_router
-from .students import router as students_router
-from .professors import router as professors_router
+import importlib
 
 __all__ = [
     "health",
-    "users", 
+    "users",
     "access_cards",
     "access_logs",
     "rooms",
     "reservations",
     "students",
-    "professors"
-] 
\ No newline at end of file
+    "professors",
+    "authentication"
+]
+
+
+# Mount point and OpenAPI tag per router module, in registration order
+_ROUTES = (
+    ("health", "/api/v1", "health"),
+    ("users", "/api/v1/users", "users"),
+    ("access_cards", "/api/v1/access-cards", "access-cards"),
+    ("access_logs", "/api/v1/access-logs", "access-logs"),
+    ("rooms", "/api/v1/rooms", "rooms"),
+    ("reservations", "/api/v1/reservations", "reservations"),
+    ("students", "/api/v1/students", "students"),
+    ("professors", "/api/v1/professors", "professors"),
+    ("authentication", "/api/v1/auth", "auth"),
+)
+
+
+def register_routers(app, names=None):
+    """
+    Import router modules and include them in the application.
+
+    Args:
+        app: FastAPI application
+        names: Router module names to mount; all of them when omitted
+    """
+    for name, prefix, tag in _ROUTES:
+        if names is None or name in names:
+            module = importlib.import_module(f".{name}", __name__)
+            app.include_router(module.router, prefix=prefix, tags=[tag])
+
+
+def __getattr__(name):
+    """Import router modules lazily on first access."""
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    module_name = name.removesuffix("_router")
+    if module_name != name and module_name in __all__:
+        return importlib.import_module(f".{module_name}", __name__).router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
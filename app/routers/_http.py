@@ -0,0 +1,33 @@
+"""
+HTTP helpers shared by the router modules.
+"""
+
+from hashlib import blake2b
+
+from fastapi import Request, Response
+
+def cached_json_response(request: Request, content: bytes) -> Response:
+    """
+    Wrap a serialized response with an ETag so clients can revalidate
+    instead of refetching the body.
+    
+    The resources change (a card can be reported lost at any time), so
+    clients must revalidate on every use and shared caches must not keep
+    them: a 304 still saves the body.
+    
+    Args:
+        request: Incoming request, checked for If-None-Match
+        content: JSON-encoded response body
+        
+    Returns:
+        The JSON response, or an empty 304 if the client's copy is current
+    """
+    etag = f'"{blake2b(content, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # The body hash is strong, but clients may echo it back as weak
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
@@ -3,23 +3,62 @@ Access Cards router for Campus Access Management System.
 Handles access card CRUD operations and status management.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import bindparam, delete, exists, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
 
-from app.models.base import get_db
-from app.models.database_models import AccessCard, User
+from app.models.base import get_async_db, paginate, violated_column
+from app.models.database_models import AccessCard, AccessLog, User
 from app.models.schemas import (
-    AccessCardCreate, AccessCardUpdate, AccessCardResponse,
-    PaginationParams, PaginatedResponse, ErrorResponse
+    AccessCardCreate, AccessCardUpdate, AccessCardResponse, CardStatusEnum,
+    PaginatedResponse,
+    ACCESS_CARD_PAGE_ADAPTER, dump_json, dump_constructed
 )
+from app.routers._http import cached_json_response
 
 router = APIRouter()
 
+# List endpoints project only the columns AccessCardResponse serializes
+_CARD_COLUMNS = (AccessCard.id, AccessCard.user_id, AccessCard.card_number, AccessCard.status, AccessCard.issued_at)
+_SELECT_CARDS = select(*_CARD_COLUMNS).order_by(AccessCard.id)
+_SELECT_USER_CARDS = (
+    select(*_CARD_COLUMNS).where(AccessCard.user_id == bindparam("user_id")).order_by(AccessCard.id)
+)
+
+# Existence checks answered with SELECT EXISTS, without hydrating a row
+_EXISTS_BY_ID = {User: select(exists().where(User.id == bindparam("id")))}
+
+# A card's access logs go with it. The schema's ON DELETE SET NULL would
+# otherwise leave them behind without a card
+_DELETE_CARD_LOGS = delete(AccessLog).where(AccessLog.card_id == bindparam("card_id"))
+
+async def _exists(db: AsyncSession, model, id_) -> bool:
+    """Check whether a row with the given primary key exists, without loading it."""
+    return await db.scalar(_EXISTS_BY_ID[model], {"id": id_})
+
+def _create_conflict(error: IntegrityError) -> HTTPException:
+    """Map an IntegrityError raised while creating a card to a response."""
+    if violated_column(error, ("card_number",)) == "card_number":
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Access card with this number already exists"
+        )
+    # Otherwise the users foreign key failed: the user was deleted after the check
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="User not found"
+    )
+
+def _cards_response(request: Request, page) -> Response:
+    """Serialize a page of access cards in one pydantic-core pass, bypassing FastAPI's response encoding."""
+    return cached_json_response(request, dump_json(ACCESS_CARD_PAGE_ADAPTER, page))
+
 @router.post("/", response_model=AccessCardResponse, status_code=status.HTTP_201_CREATED)
 async def create_access_card(
     card_data: AccessCardCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a new access card.
@@ -35,21 +74,12 @@ async def create_access_card(
         HTTPException: If user not found or card number already exists
     """
     # Check if user exists
-    user = db.query(User).filter(User.id == card_data.user_id).first()
-    if not user:
+    if not await _exists(db, User, card_data.user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    # Check if card number already exists
-    existing_card = db.query(AccessCard).filter(AccessCard.card_number == card_data.card_number).first()
-    if existing_card:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Access card with this number already exists"
-        )
-    
     # Create new access card
     db_card = AccessCard(
         user_id=card_data.user_id,
@@ -58,38 +88,53 @@ async def create_access_card(
     )
     
     db.add(db_card)
-    db.commit()
-    db.refresh(db_card)
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        # card_number is unique; let the database reject duplicates
+        await db.rollback()
+        raise _create_conflict(e)
     
-    return db_card
+    return Response(
+        content=dump_constructed(AccessCardResponse, db_card),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json"
+    )
 
-@router.get("/", response_model=List[AccessCardResponse])
+@router.get("/", response_model=PaginatedResponse[AccessCardResponse])
 async def get_access_cards(
-    db: Session = Depends(get_db)
+    request: Request,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get all access cards.
+    Get access cards, one page at a time.
     
     Args:
+        request: Incoming request
+        skip: Number of records to skip
+        limit: Maximum number of records to return
         db: Database session
         
     Returns:
-        List of all access cards
+        Page of access cards with the total count
     """
-    # Get all access cards
-    cards = db.query(AccessCard).all()
+    page = await paginate(db, _SELECT_CARDS, skip, limit)
     
-    return cards
+    return _cards_response(request, page)
 
 @router.get("/{card_id}", response_model=AccessCardResponse)
 async def get_access_card(
-    card_id: str,
-    db: Session = Depends(get_db)
+    request: Request,
+    card_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a specific access card by ID.
     
     Args:
+        request: Incoming request
         card_id: Access card ID
         db: Database session
         
@@ -99,51 +144,56 @@ async def get_access_card(
     Raises:
         HTTPException: If access card not found
     """
-    card = db.query(AccessCard).filter(AccessCard.id == card_id).first()
+    card = await db.get(AccessCard, card_id)
     if not card:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Access card not found"
         )
     
-    return card
+    return cached_json_response(request, dump_constructed(AccessCardResponse, card))
 
-@router.get("/user/{user_id}", response_model=List[AccessCardResponse])
+@router.get("/user/{user_id}", response_model=PaginatedResponse[AccessCardResponse])
 async def get_user_access_cards(
-    user_id: str,
-    db: Session = Depends(get_db)
+    request: Request,
+    user_id: UUID,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get all access cards for a specific user.
+    Get the access cards of a specific user, one page at a time.
     
     Args:
+        request: Incoming request
         user_id: User ID
+        skip: Number of records to skip
+        limit: Maximum number of records to return
         db: Database session
         
     Returns:
-        List of access cards for the user
+        Page of access cards for the user with the total count
         
     Raises:
         HTTPException: If user not found
     """
     # Check if user exists
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    if not await _exists(db, User, user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
     # Get access cards for the user
-    cards = db.query(AccessCard).filter(AccessCard.user_id == user_id).all()
+    page = await paginate(db, _SELECT_USER_CARDS, skip, limit, {"user_id": user_id})
     
-    return cards
+    return _cards_response(request, page)
 
 @router.put("/{card_id}", response_model=AccessCardResponse)
 async def update_access_card(
-    card_id: str,
+    card_id: UUID,
     card_data: AccessCardUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update an access card.
@@ -159,30 +209,28 @@ async def update_access_card(
     Raises:
         HTTPException: If access card not found
     """
-    card = db.query(AccessCard).filter(AccessCard.id == card_id).first()
+    update_data = card_data.model_dump(exclude_unset=True)
+    if update_data:
+        # UPDATE by primary key without loading the row first
+        await db.execute(update(AccessCard).where(AccessCard.id == card_id).values(**update_data))
+        await db.commit()
+    
+    card = await db.get(AccessCard, card_id)
     if not card:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Access card not found"
         )
     
-    # Update card fields
-    update_data = card_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(card, field, value)
-    
-    db.commit()
-    db.refresh(card)
-    
-    return card
+    return Response(content=dump_constructed(AccessCardResponse, card), media_type="application/json")
 
 @router.delete("/{card_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_access_card(
-    card_id: str,
-    db: Session = Depends(get_db)
+    card_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Delete an access card.
+    Delete an access card and its access logs.
     
     Args:
         card_id: Access card ID
@@ -191,56 +239,51 @@ async def delete_access_card(
     Raises:
         HTTPException: If access card not found
     """
-    card = db.query(AccessCard).filter(AccessCard.id == card_id).first()
+    card = await db.get(AccessCard, card_id)
     if not card:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Access card not found"
         )
     
-    db.delete(card)
-    db.commit()
+    await db.execute(_DELETE_CARD_LOGS, {"card_id": card_id})
+    await db.delete(card)
+    await db.commit()
     
     return None
 
 @router.put("/{card_id}/status", response_model=AccessCardResponse)
 async def update_card_status(
-    card_id: str,
-    status: str,
-    db: Session = Depends(get_db)
+    card_id: UUID,
+    new_status: CardStatusEnum = Query(..., alias="status"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update the status of an access card.
     
+    Invalid statuses are rejected with a 422 during request validation,
+    before the handler touches the database.
+    
     Args:
         card_id: Access card ID
-        status: New status (active, lost, disabled)
+        new_status: New status (active, lost, disabled)
         db: Database session
         
     Returns:
         Updated access card information
         
     Raises:
-        HTTPException: If access card not found or invalid status
+        HTTPException: If access card not found
     """
-    card = db.query(AccessCard).filter(AccessCard.id == card_id).first()
+    # UPDATE by primary key without loading the row first
+    await db.execute(update(AccessCard).where(AccessCard.id == card_id).values(status=new_status))
+    await db.commit()
+    
+    card = await db.get(AccessCard, card_id)
     if not card:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Access card not found"
         )
     
-    # Validate status
-    valid_statuses = ["active", "lost", "disabled"]
-    if status not in valid_statuses:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid status. Must be one of: {', '.join(valid_statuses)}"
-        )
-    
-    # Update status
-    card.status = status
-    db.commit()
-    db.refresh(card)
-    
-    return card 
\ No newline at end of file
+    return Response(content=dump_constructed(AccessCardResponse, card), media_type="application/json") 
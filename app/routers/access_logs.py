@@ -3,24 +3,132 @@ Access Logs router for Campus Access Management System.
 Handles access log CRUD operations and access simulation.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+import base64
+import binascii
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import String, and_, bindparam, case, distinct, exists, func, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from uuid import UUID, uuid4
 from datetime import datetime
 
-from app.models.base import get_db
-from app.models.database_models import AccessLog, AccessCard, User
+from app.models.base import UUIDBinary, get_async_db
+from app.models.database_models import AccessLog, AccessCard, CardStatus, User
 from app.models.schemas import (
-    AccessLogCreate, AccessLogResponse,
-    PaginationParams, PaginatedResponse, ErrorResponse
+    AccessLogCreate, AccessLogResponse, AccessTypeEnum,
+    CursorPage,
+    ACCESS_LOG_LIST_ADAPTER, ACCESS_LOG_PAGE_ADAPTER, dump_json
 )
 
 router = APIRouter()
 
+# Statements built once at import and executed with bound parameters
+_EXISTS_BY_ID = {
+    model: select(exists().where(model.id == bindparam("id")))
+    for model in (AccessCard, User)
+}
+_SELECT_LOG_BY_ID = select(AccessLog).where(AccessLog.id == bindparam("log_id"))
+_SELECT_CARD_LOGS = select(AccessLog).where(AccessLog.card_id == bindparam("card_id"))
+_SELECT_USER_LOGS = select(AccessLog).join(AccessCard).where(AccessCard.user_id == bindparam("user_id"))
+
+# Insert a log only if the referenced card exists, in one statement
+_INSERT_LOG_FOR_CARD = insert(AccessLog.__table__).from_select(
+    ["id", "card_id", "location", "access_type"],
+    select(
+        bindparam("log_id", type_=UUIDBinary),
+        AccessCard.id,
+        bindparam("location", type_=String),
+        bindparam("access_type", type_=String)
+    ).where(AccessCard.id == bindparam("card_id"))
+)
+
+# Insert a log straight from the card row; inactive cards are recorded as denied
+_INSERT_SIMULATED_LOG = insert(AccessLog.__table__).from_select(
+    ["id", "card_id", "location", "access_type"],
+    select(
+        bindparam("log_id", type_=UUIDBinary),
+        AccessCard.id,
+        bindparam("location", type_=String),
+        case((AccessCard.status == CardStatus.active, bindparam("access_type", type_=String)), else_="denied")
+    ).where(AccessCard.card_number == bindparam("card_number"))
+)
+
+# Attempts per access type, locations and cards in a single scan
+_ACCESS_STATS = select(
+    func.count().label("total"),
+    func.coalesce(func.sum(case((AccessLog.access_type == "entry", 1), else_=0)), 0).label("entries"),
+    func.coalesce(func.sum(case((AccessLog.access_type == "exit", 1), else_=0)), 0).label("exits"),
+    func.coalesce(func.sum(case((AccessLog.access_type == "denied", 1), else_=0)), 0).label("denied"),
+    func.count(distinct(AccessLog.location)).label("locations"),
+    func.count(distinct(AccessLog.card_id)).label("cards"),
+)
+
+def _json_response(adapter, data) -> Response:
+    """
+    Validate ORM rows against the response schema and serialize them to JSON
+    in a single pydantic-core pass, bypassing FastAPI's response encoding.
+    """
+    return Response(content=dump_json(adapter, data), media_type="application/json")
+
+async def _exists(db: AsyncSession, model, id_) -> bool:
+    """Check whether a row with the given primary key exists, without loading it."""
+    return await db.scalar(_EXISTS_BY_ID[model], {"id": id_})
+
+def _encode_cursor(log: AccessLog) -> str:
+    """Encode the (accessed_at, id) position of a log as an opaque cursor."""
+    raw = f"{log.accessed_at.isoformat()}|{log.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def _decode_cursor(cursor: str):
+    """
+    Decode a cursor produced by _encode_cursor.
+    
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        accessed_at, log_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(accessed_at), log_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+async def _paginate_logs(db: AsyncSession, stmt, limit: int, cursor: Optional[str]) -> dict:
+    """
+    Fetch one page of access logs, newest first, using keyset pagination.
+    
+    Args:
+        db: Database session
+        stmt: Select statement for AccessLog, without ordering or limit
+        limit: Maximum number of logs to return
+        cursor: Cursor returned with the previous page, if any
+        
+    Returns:
+        JSON response with the logs and the cursor for the next page
+    """
+    if cursor:
+        accessed_at, log_id = _decode_cursor(cursor)
+        stmt = stmt.where(or_(
+            AccessLog.accessed_at < accessed_at,
+            and_(AccessLog.accessed_at == accessed_at, AccessLog.id < log_id)
+        ))
+    
+    # Fetch one extra row to know whether another page follows
+    stmt = stmt.order_by(AccessLog.accessed_at.desc(), AccessLog.id.desc()).limit(limit + 1)
+    logs = (await db.execute(stmt)).scalars().all()
+    
+    next_cursor = _encode_cursor(logs[limit - 1]) if len(logs) > limit else None
+    return _json_response(
+        ACCESS_LOG_PAGE_ADAPTER,
+        {"items": logs[:limit], "next_cursor": next_cursor, "limit": limit}
+    )
+
 @router.post("/", response_model=AccessLogResponse, status_code=status.HTTP_201_CREATED)
 async def create_access_log(
     log_data: AccessLogCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a new access log entry.
@@ -35,33 +143,31 @@ async def create_access_log(
     Raises:
         HTTPException: If access card not found
     """
-    # Check if access card exists
-    card = db.query(AccessCard).filter(AccessCard.id == log_data.card_id).first()
-    if not card:
+    # Create the log only if the access card exists
+    log_id = str(uuid4())
+    result = await db.execute(_INSERT_LOG_FOR_CARD, {
+        "log_id": log_id,
+        "card_id": log_data.card_id,
+        "location": log_data.location,
+        "access_type": log_data.access_type.value
+    })
+    if result.rowcount == 0:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Access card not found"
         )
     
-    # Create new access log
-    db_log = AccessLog(
-        card_id=log_data.card_id,
-        location=log_data.location,
-        access_type=log_data.access_type
-    )
+    await db.commit()
     
-    db.add(db_log)
-    db.commit()
-    db.refresh(db_log)
-    
-    return db_log
+    return await db.get(AccessLog, log_id)
 
 @router.post("/simulate-access", response_model=AccessLogResponse, status_code=status.HTTP_201_CREATED)
 async def simulate_access(
     card_number: str,
     location: str,
-    access_type: str,
-    db: Session = Depends(get_db)
+    access_type: AccessTypeEnum,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Simulate an access attempt using card number.
@@ -76,63 +182,50 @@ async def simulate_access(
         Created access log information
         
     Raises:
-        HTTPException: If access card not found or invalid access type
+        HTTPException: If access card not found
     """
-    # Validate access type
-    valid_access_types = ["entry", "exit", "denied"]
-    if access_type not in valid_access_types:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid access type. Must be one of: {', '.join(valid_access_types)}"
-        )
-    
-    # Find access card by number
-    card = db.query(AccessCard).filter(AccessCard.card_number == card_number).first()
-    if not card:
+    # The card status is read and the log written atomically
+    log_id = str(uuid4())
+    result = await db.execute(_INSERT_SIMULATED_LOG, {
+        "log_id": log_id,
+        "location": location,
+        "access_type": access_type.value,
+        "card_number": card_number
+    })
+    if result.rowcount == 0:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Access card not found"
         )
     
-    # Check if card is active
-    if card.status != "active":
-        access_type = "denied"  # Force denied if card is not active
+    await db.commit()
     
-    # Create access log
-    db_log = AccessLog(
-        card_id=card.id,
-        location=location,
-        access_type=access_type
-    )
-    
-    db.add(db_log)
-    db.commit()
-    db.refresh(db_log)
-    
-    return db_log
+    return await db.get(AccessLog, log_id)
 
-@router.get("/", response_model=List[AccessLogResponse])
+@router.get("/", response_model=CursorPage[AccessLogResponse])
 async def get_access_logs(
-    db: Session = Depends(get_db)
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get all access logs.
+    Get access logs, newest first, one page at a time.
     
     Args:
+        limit: Maximum number of logs to return
+        cursor: Cursor returned with the previous page
         db: Database session
         
     Returns:
-        List of all access logs
+        Page of access logs with the cursor for the next page
     """
-    # Get all access logs
-    logs = db.query(AccessLog).all()
-    
-    return logs
+    return await _paginate_logs(db, select(AccessLog), limit, cursor)
 
 @router.get("/{log_id}", response_model=AccessLogResponse)
 async def get_access_log(
-    log_id: str,
-    db: Session = Depends(get_db)
+    log_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a specific access log by ID.
@@ -147,7 +240,7 @@ async def get_access_log(
     Raises:
         HTTPException: If access log not found
     """
-    log = db.query(AccessLog).filter(AccessLog.id == log_id).first()
+    log = (await db.execute(_SELECT_LOG_BY_ID, {"log_id": log_id})).scalar_one_or_none()
     if not log:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -158,8 +251,8 @@ async def get_access_log(
 
 @router.get("/card/{card_id}", response_model=List[AccessLogResponse])
 async def get_card_access_logs(
-    card_id: str,
-    db: Session = Depends(get_db)
+    card_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all access logs for a specific card.
@@ -175,22 +268,21 @@ async def get_card_access_logs(
         HTTPException: If access card not found
     """
     # Check if access card exists
-    card = db.query(AccessCard).filter(AccessCard.id == card_id).first()
-    if not card:
+    if not await _exists(db, AccessCard, card_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Access card not found"
         )
     
     # Get access logs for the card
-    logs = db.query(AccessLog).filter(AccessLog.card_id == card_id).all()
+    logs = (await db.execute(_SELECT_CARD_LOGS, {"card_id": card_id})).scalars().all()
     
-    return logs
+    return _json_response(ACCESS_LOG_LIST_ADAPTER, logs)
 
 @router.get("/user/{user_id}", response_model=List[AccessLogResponse])
 async def get_user_access_logs(
-    user_id: str,
-    db: Session = Depends(get_db)
+    user_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all access logs for a specific user.
@@ -205,42 +297,43 @@ async def get_user_access_logs(
     Raises:
         HTTPException: If user not found
     """
-    # Check if user exists
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    # Get access logs for all user's cards
+    logs = (await db.execute(_SELECT_USER_LOGS, {"user_id": user_id})).scalars().all()
+    
+    # Only an empty result needs to tell an unknown user from one without logs
+    if not logs and not await _exists(db, User, user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    # Get access logs for all user's cards
-    logs = db.query(AccessLog).join(AccessCard).filter(AccessCard.user_id == user_id).all()
-    
-    return logs
+    return _json_response(ACCESS_LOG_LIST_ADAPTER, logs)
 
-@router.get("/location/{location}", response_model=List[AccessLogResponse])
+@router.get("/location/{location}", response_model=CursorPage[AccessLogResponse])
 async def get_location_access_logs(
     location: str,
-    db: Session = Depends(get_db)
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get all access logs for a specific location.
+    Get access logs for a specific location, newest first, one page at a time.
     
     Args:
         location: Access location
+        limit: Maximum number of logs to return
+        cursor: Cursor returned with the previous page
         db: Database session
         
     Returns:
-        List of access logs for the location
+        Page of access logs for the location with the cursor for the next page
     """
-    # Get access logs for the location
-    logs = db.query(AccessLog).filter(AccessLog.location == location).all()
-    
-    return logs
+    stmt = select(AccessLog).where(AccessLog.location == location)
+    return await _paginate_logs(db, stmt, limit, cursor)
 
 @router.get("/stats/summary")
 async def get_access_stats(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get access statistics summary.
@@ -251,23 +344,14 @@ async def get_access_stats(
     Returns:
         Access statistics summary
     """
-    # Get total access attempts
-    total_attempts = db.query(AccessLog).count()
-    
-    # Get successful entries
-    successful_entries = db.query(AccessLog).filter(AccessLog.access_type == "entry").count()
-    
-    # Get exits
-    exits = db.query(AccessLog).filter(AccessLog.access_type == "exit").count()
-    
-    # Get denied attempts
-    denied_attempts = db.query(AccessLog).filter(AccessLog.access_type == "denied").count()
-    
-    # Get unique locations
-    unique_locations = db.query(AccessLog.location).distinct().count()
+    row = (await db.execute(_ACCESS_STATS)).one()
     
-    # Get unique cards used
-    unique_cards = db.query(AccessLog.card_id).distinct().count()
+    total_attempts = row.total
+    successful_entries = int(row.entries)
+    exits = int(row.exits)
+    denied_attempts = int(row.denied)
+    unique_locations = row.locations
+    unique_cards = row.cards
     
     return {
         "total_attempts": total_attempts,
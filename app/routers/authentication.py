@@ -1,15 +1,28 @@
-from datetime import datetime, timedelta
+import asyncio
+import hashlib
+import hmac
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from cachetools import TLRUCache, TTLCache
+
+from fastapi import APIRouter, Depends, Form, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, delete, exists, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import SessionLocal
-from app.models.database_models import User, Student, Professor
-from app.models.schemas import LoginResponse, UserResponse, ExtendedLoginResponse
+from app.models.base import get_async_db, utcnow
+from app.models.database_models import User, Student, Professor, RevokedToken
+from app.models.schemas import (
+    UserResponse, ExtendedLoginResponse,
+    StudentProfile, ProfessorProfile, AdminProfile, UserProfile
+)
 from app.config.settings import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
 
 router = APIRouter()
@@ -18,47 +31,143 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# bcrypt releases the GIL, so one thread per core hashes and verifies
+# passwords in parallel without taking slots from the threadpool used by sync
+# endpoints. Shared with the users router.
+bcrypt_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt")
+
+# Version identifiers of the bcrypt hash formats accepted by checkpw
+BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# Statements built once at import and executed with bound parameters
+_SELECT_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_SELECT_STUDENT_BY_USER = select(Student).where(Student.user_id == bindparam("user_id"))
+_SELECT_PROFESSOR_BY_USER = select(Professor).where(Professor.user_id == bindparam("user_id"))
+# The token's user, unless the token has been revoked, in one round-trip
+_SELECT_TOKEN_USER = select(User).where(
+    User.email == bindparam("email"),
+    ~exists().where(RevokedToken.token_hash == bindparam("token_hash"))
+)
+_PURGE_REVOKED_TOKENS = delete(RevokedToken).where(RevokedToken.expires_at < bindparam("now"))
+
+# Recently verified credentials: email -> (HMAC(email:password), password
+# hash that matched). Plaintext passwords are never stored.
+_verified_logins = TTLCache(maxsize=1024, ttl=30)
+
+# Decoded token payloads, kept until the token's own expiry. Only signature
+# checking is skipped; revocation and password changes are still checked
+# against the database on every request.
+_decoded_tokens = TLRUCache(
+    maxsize=4096,
+    ttu=lambda token, payload, now: payload.get("exp", 0),
+    timer=time.time
+)
+
+def forget_verified_login(email: str) -> None:
+    """Drop the cached credential check of an account whose password changed."""
+    _verified_logins.pop(email, None)
+
+async def password_form(
+    username: str = Form(...),
+    password: str = Form(...)
+) -> OAuth2PasswordRequestForm:
+    """
+    Coroutine wrapper around OAuth2PasswordRequestForm.
+
+    Class dependencies are instantiated in the threadpool; declaring the form
+    fields on a coroutine lets FastAPI resolve them on the event loop.
+    """
+    return OAuth2PasswordRequestForm(username=username, password=password)
 
-def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
-    user = db.query(User).filter(User.email == username).first()
+def _credentials_key(username: str, password: str) -> bytes:
+    return hmac.new(SECRET_KEY.encode(), f"{username}:{password}".encode(), hashlib.sha256).digest()
+
+async def authenticate_user(db: AsyncSession, username: str, password: str) -> Optional[User]:
+    user = (await db.execute(_SELECT_USER_BY_EMAIL, {"email": username})).scalar_one_or_none()
     if not user:
         return None
-    if not pwd_context.verify(password, user.password_hash):
+
+    key = _credentials_key(username, password)
+    cached = _verified_logins.get(username)
+    if cached is not None and hmac.compare_digest(cached[0], key) and cached[1] == user.password_hash:
+        return user
+
+    # Anything that is not a bcrypt hash can never match; skip the slow path
+    if not user.password_hash.startswith(BCRYPT_PREFIXES):
+        return None
+
+    # bcrypt is deliberately slow; keep it off the event loop
+    loop = asyncio.get_running_loop()
+    if not await loop.run_in_executor(bcrypt_pool, pwd_context.verify, password, user.password_hash):
         return None
+    _verified_logins[username] = (key, user.password_hash)
     return user
 
+def _password_stamp(password_hash: str) -> str:
+    """
+    Keyed digest of a password hash, carried in access tokens so that they
+    stop working once the password changes.
+    """
+    return hmac.new(SECRET_KEY.encode(), password_hash.encode(), hashlib.sha256).hexdigest()[:16]
+
+def _token_hash(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
+    expire = utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Impossible de valider les informations d'identification",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
+    payload = _decoded_tokens.get(token)
+    if payload is None:
+        try:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        except JWTError:
             raise credentials_exception
-    except JWTError:
-        raise credentials_exception
+        if payload.get("sub") is None:
+            raise credentials_exception
+        _decoded_tokens[token] = payload
+    username: str = payload["sub"]
 
-    user = db.query(User).filter(User.email == username).first()
+    # The user is read on every request, so deletions and role changes take
+    # effect immediately on every worker
+    user = (await db.execute(
+        _SELECT_TOKEN_USER, {"email": username, "token_hash": _token_hash(token)}
+    )).scalar_one_or_none()
     if user is None:
         raise credentials_exception
+    # Tokens issued before the last password change are no longer valid
+    if not hmac.compare_digest(str(payload.get("pwd", "")), _password_stamp(user.password_hash)):
+        raise credentials_exception
+
     return user
 
-def get_user_profile(user: User, db: Session) -> Optional[dict]:
+async def _load_student_profile(user: User, db: AsyncSession) -> Optional[StudentProfile]:
+    student = (await db.execute(_SELECT_STUDENT_BY_USER, {"user_id": user.id})).scalar_one_or_none()
+    return StudentProfile.model_validate(student) if student else None
+
+async def _load_professor_profile(user: User, db: AsyncSession) -> Optional[ProfessorProfile]:
+    professor = (await db.execute(_SELECT_PROFESSOR_BY_USER, {"user_id": user.id})).scalar_one_or_none()
+    return ProfessorProfile.model_validate(professor) if professor else None
+
+async def _load_admin_profile(user: User, db: AsyncSession) -> AdminProfile:
+    # Admins have no profile table; their basic info is the profile
+    return AdminProfile(id=user.id, email=user.email, role=user.role.value)
+
+PROFILE_LOADERS = {
+    "student": _load_student_profile,
+    "professor": _load_professor_profile,
+    "admin": _load_admin_profile,
+}
+
+async def get_user_profile(user: User, db: AsyncSession) -> Optional[UserProfile]:
     """
     Get full user profile information based on user role.
     
@@ -67,50 +176,18 @@ def get_user_profile(user: User, db: Session) -> Optional[dict]:
         db: Database session
         
     Returns:
-        Dictionary containing full profile information or None for admin users
+        Profile model for the user's role, or None if the user has no profile
     """
-    if user.role.value == "student":
-        # Get student profile
-        student = db.query(Student).filter(Student.user_id == user.id).first()
-        if student:
-            return {
-                "type": "student",
-                "id": student.id,
-                "full_name": student.full_name,
-                "student_card_id": student.student_card_id,
-                "email": student.email,
-                "class_name": student.class_name,
-                "phone_number": student.phone_number,
-                "registered_at": student.registered_at.isoformat() if student.registered_at else None
-            }
-    elif user.role.value == "professor":
-        # Get professor profile
-        professor = db.query(Professor).filter(Professor.user_id == user.id).first()
-        if professor:
-            return {
-                "type": "professor",
-                "id": professor.id,
-                "full_name": professor.full_name,
-                "email": professor.email,
-                "department": professor.department,
-                "phone_number": professor.phone_number,
-                "office": professor.office
-            }
-    elif user.role.value == "admin":
-        # For admin users, return basic admin info
-        return {
-            "type": "admin",
-            "id": user.id,
-            "email": user.email,
-            "role": user.role.value
-        }
+    loader = PROFILE_LOADERS.get(user.role.value)
+    if loader is None:
+        return None
     
-    return None
+    return await loader(user, db)
 
 @router.post("/login", response_model=ExtendedLoginResponse, summary="Connexion utilisateur")
 async def login_for_access_token(
-    form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    form_data: OAuth2PasswordRequestForm = Depends(password_form),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Authenticate user and return access token with user information and full profile details.
@@ -125,7 +202,7 @@ async def login_for_access_token(
     Raises:
         HTTPException: If authentication fails
     """
-    user = authenticate_user(db, form_data.username, form_data.password)
+    user = await authenticate_user(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -134,10 +211,12 @@ async def login_for_access_token(
         )
     
     # Create access token
-    access_token = create_access_token(data={"sub": user.email})
+    access_token = create_access_token(
+        data={"sub": user.email, "pwd": _password_stamp(user.password_hash)}
+    )
     
     # Get full profile information
-    profile = get_user_profile(user, db)
+    profile = await get_user_profile(user, db)
     
     # Return token, user information, and profile details
     return ExtendedLoginResponse(
@@ -149,7 +228,35 @@ async def login_for_access_token(
     )
 
 @router.post("/logout", summary="Déconnexion utilisateur")
-async def logout(current_user: User = Depends(get_current_user)):
+async def logout(
+    token: str = Depends(oauth2_scheme),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Revoke the current access token.
+    
+    The revocation is stored in the database, so it applies to every worker
+    until the token expires; expired revocations are purged on the way.
+    
+    Args:
+        token: Access token being revoked
+        current_user: Current authenticated user (from token)
+        db: Database session
+        
+    Returns:
+        Confirmation message
+    """
+    exp = jwt.get_unverified_claims(token)["exp"]
+    # Stored as naive UTC, the same form utcnow() returns
+    expires_at = datetime.fromtimestamp(exp, timezone.utc).replace(tzinfo=None)
+    await db.execute(_PURGE_REVOKED_TOKENS, {"now": utcnow()})
+    db.add(RevokedToken(token_hash=_token_hash(token), expires_at=expires_at))
+    try:
+        await db.commit()
+    except IntegrityError:
+        # A concurrent logout with the same token already revoked it
+        await db.rollback()
     return {"message": "Déconnexion réussie"}
 
 @router.get("/me", response_model=UserResponse, summary="Obtenir les informations de l'utilisateur actuel")
@@ -3,55 +3,93 @@ Health check router.
 Contains endpoints for monitoring application health and status.
 """
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
-from datetime import datetime
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from cachetools import TTLCache, cached
 import os
 import logging
+import threading
+import time
+import orjson
 
-from app.database.migrations import check_database_connection, get_existing_tables, check_table_data
+from app.database.migrations import check_database_connection, get_existing_tables, check_tables_data, REQUIRED_TABLES
+from app.models.base import async_engine, engine, utcnow
 
 # Create router instance
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Static part of the /health body, serialized once; only the timestamp is
+# appended per request.
+_HEALTH_BODY_PREFIX = orjson.dumps({
+    "status": "healthy",
+    "service": "Campus Access Management System",
+    "version": "1.0.0"
+})[:-1] + b',"timestamp":'
+
+# Last formatted timestamp and when it was taken; probes within the same
+# second share one string.
+_ts_cache = ("", 0.0)
+
+def _now_iso():
+    """Current UTC time in ISO format, refreshed at most once per second."""
+    global _ts_cache
+    now = time.time()
+    if now - _ts_cache[1] >= 1.0:
+        _ts_cache = (utcnow().isoformat(), now)
+    return _ts_cache[0]
+
+# Full /health body and the timestamp it was built with; rebuilt only when
+# _now_iso() moves on, so probes within the same second reuse the bytes.
+_health_body = (b"", "")
+
+def _health_bytes():
+    """The /health response body for the current timestamp."""
+    global _health_body
+    timestamp = _now_iso()
+    if _health_body[1] is not timestamp:
+        _health_body = (_HEALTH_BODY_PREFIX + orjson.dumps(timestamp) + b"}", timestamp)
+    return _health_body[0]
+
+@cached(TTLCache(maxsize=1, ttl=5), lock=threading.Lock())
+def _database_connected():
+    """Database connectivity, re-checked at most every 5 seconds across probes."""
+    return check_database_connection()
+
 @router.get("/health")
 async def health_check():
     """
     Basic health check endpoint.
     Returns application status and basic information.
     """
-    return JSONResponse(
-        content={
-            "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
-            "service": "Campus Access Management System",
-            "version": "1.0.0"
-        },
-        status_code=200
-    )
+    return Response(content=_health_bytes(), media_type="application/json")
 
+# Probes that touch the database are plain def handlers: the migration
+# helpers use the blocking engine, so FastAPI runs them in its threadpool
+# instead of on the event loop.
 @router.get("/health/detailed")
-async def detailed_health_check():
+def detailed_health_check():
     """
     Detailed health check endpoint.
     Returns comprehensive system information and application status.
     """
     try:
         # Check database connection
-        db_connected = check_database_connection()
+        db_connected = _database_connected()
         tables = get_existing_tables() if db_connected else []
         
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "status": "healthy" if db_connected else "degraded",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _now_iso(),
                 "service": "Campus Access Management System",
                 "version": "1.0.0",
                 "database": {
                     "connected": db_connected,
                     "tables": tables,
-                    "table_count": len(tables)
+                    "table_count": len(tables),
+                    "pool": engine.pool.status(),
+                    "async_pool": async_engine.pool.status()
                 },
                 "environment": {
                     "python_version": os.sys.version,
@@ -68,20 +106,20 @@ async def detailed_health_check():
         )
 
 @router.get("/ready")
-async def readiness_check():
+def readiness_check():
     """
     Readiness check endpoint.
     Used by load balancers and orchestration systems to determine if the service is ready to receive traffic.
     """
     try:
         # Check database connection
-        db_connected = check_database_connection()
+        db_connected = _database_connected()
         
         if not db_connected:
-            return JSONResponse(
+            return ORJSONResponse(
                 content={
                     "status": "not_ready",
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": _now_iso(),
                     "reason": "Database connection failed"
                 },
                 status_code=503
@@ -89,23 +127,26 @@ async def readiness_check():
         
         # Check if required tables exist
         tables = get_existing_tables()
-        required_tables = ['users', 'access_cards', 'rooms', 'access_logs', 'room_reservations', 'students', 'professors', 'roles', 'user_roles']
-        missing_tables = [table for table in required_tables if table not in tables]
+        missing_tables = sorted(REQUIRED_TABLES.difference(tables))
+        if missing_tables:
+            # Tables may have been created since the cached lookup
+            tables = get_existing_tables(force=True)
+            missing_tables = sorted(REQUIRED_TABLES.difference(tables))
         
         if missing_tables:
-            return JSONResponse(
+            return ORJSONResponse(
                 content={
                     "status": "not_ready",
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": _now_iso(),
                     "reason": f"Missing required tables: {missing_tables}"
                 },
                 status_code=503
             )
         
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "status": "ready",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _now_iso(),
                 "database": {
                     "connected": True,
                     "tables": tables
@@ -115,30 +156,30 @@ async def readiness_check():
         )
     except Exception as e:
         logger.error(f"Readiness check failed: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "status": "not_ready",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _now_iso(),
                 "reason": f"Readiness check failed: {str(e)}"
             },
             status_code=503
         )
 
 @router.get("/health/database")
-async def database_health_check():
+def database_health_check():
     """
     Database-specific health check endpoint.
     Returns detailed database status and table information.
     """
     try:
         # Check database connection
-        db_connected = check_database_connection()
+        db_connected = _database_connected()
         
         if not db_connected:
-            return JSONResponse(
+            return ORJSONResponse(
                 content={
                     "status": "unhealthy",
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": _now_iso(),
                     "database": {
                         "connected": False,
                         "error": "Database connection failed"
@@ -151,17 +192,20 @@ async def database_health_check():
         tables = get_existing_tables()
         table_info = {}
         
+        # All row counts come back from a single query
+        counts = check_tables_data(REQUIRED_TABLES.intersection(tables))
         for table in tables:
-            row_count = check_table_data(table)
+            if table not in REQUIRED_TABLES:
+                continue
             table_info[table] = {
                 "exists": True,
-                "row_count": row_count
+                "row_count": counts[table]
             }
         
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "status": "healthy",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _now_iso(),
                 "database": {
                     "connected": True,
                     "tables": table_info,
@@ -172,10 +216,10 @@ async def database_health_check():
         )
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "status": "unhealthy",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _now_iso(),
                 "database": {
                     "connected": False,
                     "error": str(e)
@@ -3,23 +3,79 @@ Professors router for Campus Access Management System.
 Handles professor profile CRUD operations and management.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import bindparam, delete, exists, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
 
-from app.models.base import get_db
+from app.models.base import get_async_db, is_foreign_key_violation, paginate, violated_column
 from app.models.database_models import Professor, User
 from app.models.schemas import (
     ProfessorCreate, ProfessorUpdate, ProfessorResponse,
-    PaginationParams, PaginatedResponse, ErrorResponse
+    PaginatedResponse,
+    PROFESSOR_PAGE_ADAPTER, dump_json
 )
+from app.routers._http import cached_json_response
 
 router = APIRouter()
 
+# Statements are built once; SQLAlchemy caches their compiled form
+# List endpoints project only the columns ProfessorResponse serializes
+_PROFESSOR_COLUMNS = (
+    Professor.id, Professor.user_id, Professor.full_name, Professor.email,
+    Professor.department, Professor.phone_number, Professor.office
+)
+_SELECT_PROFESSORS = select(*_PROFESSOR_COLUMNS).order_by(Professor.id)
+_SELECT_PROFESSOR_BY_USER = select(Professor).where(Professor.user_id == bindparam("user_id"))
+_SELECT_PROFESSORS_BY_DEPARTMENT = (
+    select(*_PROFESSOR_COLUMNS).where(Professor.department == bindparam("department")).order_by(Professor.id)
+)
+
+# User row plus whether it already has a profile, checked before an insert
+_CREATE_CHECKS = select(
+    User.id,
+    exists().where(Professor.user_id == bindparam("user_id")).label("has_profile")
+).where(User.id == bindparam("user_id"))
+
+# Stats summary: one aggregate row plus the per-department breakdown. The
+# number of distinct values comes from the GROUP BY rows, so no
+# COUNT(DISTINCT) is issued
+_PROFESSOR_TOTALS = select(
+    func.count().label("total"),
+    func.count(Professor.phone_number).label("with_phone"),
+    func.count(Professor.office).label("with_office")
+)
+_PROFESSORS_PER_DEPARTMENT = select(Professor.department, func.count().label("count")).group_by(Professor.department)
+
+# Unique columns and the error reported when a write collides with them
+_UNIQUE_VIOLATIONS = {
+    "email": "Professor with this email already exists",
+    "user_id": "User already has a professor profile",
+}
+
+def _conflict(error: IntegrityError) -> HTTPException:
+    """
+    Map an IntegrityError on professors: a missing user to a 404, a
+    unique-constraint violation to a 400.
+    """
+    # The user was deleted after the existence check; checked first since
+    # the foreign key message also names user_id
+    if is_foreign_key_violation(error):
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    column = violated_column(error, _UNIQUE_VIOLATIONS)
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=_UNIQUE_VIOLATIONS.get(column, "Professor with this email already exists")
+    )
+
 @router.post("/", response_model=ProfessorResponse, status_code=status.HTTP_201_CREATED)
 async def create_professor(
     professor_data: ProfessorCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a new professor profile.
@@ -34,30 +90,20 @@ async def create_professor(
     Raises:
         HTTPException: If user not found or email already exists
     """
-    # Check if user exists
-    user = db.query(User).filter(User.id == professor_data.user_id).first()
-    if not user:
+    # Fetch the user and its existing-profile flag in a single round-trip;
+    # email uniqueness is enforced by the database on commit
+    checks = (await db.execute(_CREATE_CHECKS, {"user_id": professor_data.user_id})).first()
+    if checks is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-    
-    # Check if user already has a professor profile
-    existing_professor = db.query(Professor).filter(Professor.user_id == professor_data.user_id).first()
-    if existing_professor:
+    if checks.has_profile:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User already has a professor profile"
         )
     
-    # Check if email already exists
-    existing_email = db.query(Professor).filter(Professor.email == professor_data.email).first()
-    if existing_email:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Professor with this email already exists"
-        )
-    
     # Create new professor profile
     db_professor = Professor(
         user_id=professor_data.user_id,
@@ -69,33 +115,41 @@ async def create_professor(
     )
     
     db.add(db_professor)
-    db.commit()
-    db.refresh(db_professor)
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        raise _conflict(e)
     
     return db_professor
 
-@router.get("/", response_model=List[ProfessorResponse])
+@router.get("/", response_model=PaginatedResponse[ProfessorResponse])
 async def get_professors(
-    db: Session = Depends(get_db)
+    request: Request,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get all professors.
+    Get professors, one page at a time.
     
     Args:
+        request: Incoming request
+        skip: Number of records to skip
+        limit: Maximum number of records to return
         db: Database session
         
     Returns:
-        List of all professors
+        Page of professors with the total count
     """
-    # Get all professors
-    professors = db.query(Professor).all()
-    
-    return professors
+    # Clients revalidate with the ETag; unchanged pages cost a 304
+    page = await paginate(db, _SELECT_PROFESSORS, skip, limit)
+    return cached_json_response(request, dump_json(PROFESSOR_PAGE_ADAPTER, page))
 
 @router.get("/{professor_id}", response_model=ProfessorResponse)
 async def get_professor(
-    professor_id: str,
-    db: Session = Depends(get_db)
+    professor_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a specific professor by ID.
@@ -110,7 +164,7 @@ async def get_professor(
     Raises:
         HTTPException: If professor not found
     """
-    professor = db.query(Professor).filter(Professor.id == professor_id).first()
+    professor = await db.get(Professor, professor_id)
     if not professor:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -121,8 +175,8 @@ async def get_professor(
 
 @router.get("/user/{user_id}", response_model=ProfessorResponse)
 async def get_professor_by_user_id(
-    user_id: str,
-    db: Session = Depends(get_db)
+    user_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get professor profile by user ID.
@@ -137,7 +191,7 @@ async def get_professor_by_user_id(
     Raises:
         HTTPException: If professor not found
     """
-    professor = db.query(Professor).filter(Professor.user_id == user_id).first()
+    professor = await db.scalar(_SELECT_PROFESSOR_BY_USER, {"user_id": user_id})
     if not professor:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -146,29 +200,35 @@ async def get_professor_by_user_id(
     
     return professor
 
-@router.get("/department/{department}", response_model=List[ProfessorResponse])
+@router.get("/department/{department}", response_model=PaginatedResponse[ProfessorResponse])
 async def get_professors_by_department(
     department: str,
-    db: Session = Depends(get_db)
+    request: Request,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get all professors in a specific department.
+    Get professors in a specific department, one page at a time.
     
     Args:
         department: Department name
+        request: Incoming request
+        skip: Number of records to skip
+        limit: Maximum number of records to return
         db: Database session
         
     Returns:
-        List of professors in the department
+        Page of professors in the department with the total count
     """
-    professors = db.query(Professor).filter(Professor.department == department).all()
-    return professors
+    page = await paginate(db, _SELECT_PROFESSORS_BY_DEPARTMENT, skip, limit, {"department": department})
+    return cached_json_response(request, dump_json(PROFESSOR_PAGE_ADAPTER, page))
 
 @router.put("/{professor_id}", response_model=ProfessorResponse)
 async def update_professor(
-    professor_id: str,
+    professor_id: UUID,
     professor_data: ProfessorUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update a professor profile.
@@ -184,36 +244,29 @@ async def update_professor(
     Raises:
         HTTPException: If professor not found or email already exists
     """
-    professor = db.query(Professor).filter(Professor.id == professor_id).first()
+    update_data = professor_data.model_dump(exclude_unset=True)
+    if update_data:
+        # UPDATE by primary key without loading the row first
+        try:
+            await db.execute(update(Professor).where(Professor.id == professor_id).values(**update_data))
+            await db.commit()
+        except IntegrityError as e:
+            await db.rollback()
+            raise _conflict(e)
+    
+    professor = await db.get(Professor, professor_id)
     if not professor:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Professor not found"
         )
     
-    # Check if email is being updated and if it already exists
-    if professor_data.email and professor_data.email != professor.email:
-        existing_email = db.query(Professor).filter(Professor.email == professor_data.email).first()
-        if existing_email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Professor with this email already exists"
-            )
-    
-    # Update professor fields
-    update_data = professor_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(professor, field, value)
-    
-    db.commit()
-    db.refresh(professor)
-    
     return professor
 
 @router.delete("/{professor_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_professor(
-    professor_id: str,
-    db: Session = Depends(get_db)
+    professor_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete a professor profile.
@@ -225,21 +278,20 @@ async def delete_professor(
     Raises:
         HTTPException: If professor not found
     """
-    professor = db.query(Professor).filter(Professor.id == professor_id).first()
-    if not professor:
+    # Single DELETE without loading the row first
+    result = await db.execute(delete(Professor).where(Professor.id == professor_id))
+    if not result.rowcount:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Professor not found"
         )
-    
-    db.delete(professor)
-    db.commit()
+    await db.commit()
     
     return None
 
 @router.get("/stats/summary")
 async def get_professor_stats(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get professor statistics summary.
@@ -250,31 +302,19 @@ async def get_professor_stats(
     Returns:
         Professor statistics summary
     """
-    # Get total professors
-    total_professors = db.query(Professor).count()
-    
-    # Get unique departments
-    unique_departments = db.query(Professor.department).distinct().count()
-    
-    # Get professors by department
-    department_counts = db.query(
-        Professor.department,
-        db.func.count(Professor.id).label('count')
-    ).group_by(Professor.department).all()
-    
-    # Get professors with phone numbers
-    professors_with_phone = db.query(Professor).filter(Professor.phone_number.isnot(None)).count()
+    totals = (await db.execute(_PROFESSOR_TOTALS)).one()
+    department_counts = (await db.execute(_PROFESSORS_PER_DEPARTMENT)).all()
     
-    # Get professors with offices
-    professors_with_office = db.query(Professor).filter(Professor.office.isnot(None)).count()
+    # NULL is grouped but does not count as a distinct value
+    unique_departments = sum(1 for department, _ in department_counts if department is not None)
     
     return {
-        "total_professors": total_professors,
+        "total_professors": totals.total,
         "unique_departments": unique_departments,
-        "professors_with_phone": professors_with_phone,
-        "professors_with_office": professors_with_office,
+        "professors_with_phone": totals.with_phone,
+        "professors_with_office": totals.with_office,
         "department_distribution": [
             {"department": department, "count": count}
             for department, count in department_counts
         ]
-    } 
\ No newline at end of file
+    }
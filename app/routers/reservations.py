@@ -3,116 +3,217 @@ Room Reservations router for Campus Access Management System.
 Handles room reservation CRUD operations and availability checking.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import DateTime, Integer, bindparam, case, exists, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager
+from uuid import UUID, uuid4
 from datetime import datetime
 
-from app.models.base import get_db
+from app.models.base import UUIDBinary, get_async_db, paginate, utcnow
 from app.models.database_models import RoomReservation, Room, User
 from app.models.schemas import (
     RoomReservationCreate, RoomReservationUpdate, RoomReservationResponse, ExtendedRoomReservationResponse,
-    PaginationParams, PaginatedResponse, ErrorResponse
+    PaginatedResponse,
+    RESERVATION_PAGE_ADAPTER, EXTENDED_RESERVATION_PAGE_ADAPTER, dump_json, dump_constructed
 )
+from app.routers._http import cached_json_response
 
 router = APIRouter()
 
-@router.post("/", response_model=RoomReservationResponse, status_code=status.HTTP_201_CREATED)
-async def create_reservation(
-    reservation_data: RoomReservationCreate,
-    db: Session = Depends(get_db)
-):
+# List endpoints project only the columns RoomReservationResponse serializes
+_RESERVATION_COLUMNS = (
+    RoomReservation.id, RoomReservation.room_id, RoomReservation.reserved_by,
+    RoomReservation.start_time, RoomReservation.end_time, RoomReservation.expected_occupants
+)
+_SELECT_RESERVATIONS = select(*_RESERVATION_COLUMNS).order_by(RoomReservation.id)
+_SELECT_ROOM_RESERVATIONS = (
+    select(*_RESERVATION_COLUMNS)
+    .where(RoomReservation.room_id == bindparam("room_id"))
+    .order_by(RoomReservation.id)
+)
+# The joined room row populates RoomReservation.room, avoiding a lazy load per reservation
+_SELECT_USER_RESERVATIONS = (
+    select(RoomReservation)
+    .join(Room)
+    .options(contains_eager(RoomReservation.room))
+    .where(RoomReservation.reserved_by == bindparam("user_id"))
+    .order_by(RoomReservation.id)
+)
+
+# Existence checks answered with SELECT EXISTS, without hydrating a row
+_EXISTS_BY_ID = {
+    model: select(exists().where(model.id == bindparam("id")))
+    for model in (Room, User)
+}
+
+# Bookings of a room overlapping the half-open [start_time, end_time)
+# interval; served by the (room_id, start_time, end_time) index
+_OVERLAP_CRITERIA = (
+    RoomReservation.room_id == bindparam("room_id"),
+    RoomReservation.start_time < bindparam("end_time"),
+    RoomReservation.end_time > bindparam("start_time")
+)
+_OVERLAPS = exists().where(*_OVERLAP_CRITERIA)
+# Room name plus an EXISTS probe that stops at the first overlapping booking
+_SELECT_ROOM_AVAILABILITY = select(Room.name, _OVERLAPS.label("booked")).where(
+    Room.id == bindparam("room_id")
+)
+_SELECT_OVERLAPPING = select(
+    RoomReservation.id, RoomReservation.start_time, RoomReservation.end_time, RoomReservation.reserved_by
+).where(*_OVERLAP_CRITERIA)
+
+# The same overlap, ignoring the reservation being moved
+_OTHER_OVERLAP = select(_OVERLAPS.where(RoomReservation.id != bindparam("reservation_id")))
+
+# Insert a reservation only if the room and user exist, the room is large
+# enough and the slot is free, in one statement
+_INSERT_RESERVATION = insert(RoomReservation.__table__).from_select(
+    ["id", "room_id", "reserved_by", "start_time", "end_time", "expected_occupants"],
+    select(
+        bindparam("reservation_id", type_=UUIDBinary),
+        Room.id,
+        bindparam("reserved_by", type_=UUIDBinary),
+        bindparam("start_time", type_=DateTime),
+        bindparam("end_time", type_=DateTime),
+        bindparam("expected_occupants", type_=Integer)
+    ).where(
+        Room.id == bindparam("room_id"),
+        exists().where(User.id == bindparam("reserved_by")),
+        Room.capacity >= bindparam("expected_occupants"),
+        ~_OVERLAPS
+    )
+)
+
+# Upcoming, past and ongoing counts relative to the bound "now", in a single scan
+_RESERVATION_STATS = select(
+    func.count().label("total"),
+    func.coalesce(func.sum(case((RoomReservation.start_time > bindparam("now"), 1), else_=0)), 0).label("active"),
+    func.coalesce(func.sum(case((RoomReservation.end_time < bindparam("now"), 1), else_=0)), 0).label("past"),
+    func.coalesce(func.sum(case(
+        ((RoomReservation.start_time <= bindparam("now")) & (RoomReservation.end_time >= bindparam("now")), 1),
+        else_=0
+    )), 0).label("current"),
+    func.coalesce(func.sum(RoomReservation.expected_occupants), 0).label("occupants"),
+)
+
+async def _exists(db: AsyncSession, model, id_) -> bool:
+    """Check whether a row with the given primary key exists, without loading it."""
+    return await db.scalar(_EXISTS_BY_ID[model], {"id": id_})
+
+def _json_response(request: Request, adapter, data) -> Response:
+    """Serialize query results in one pydantic-core pass, bypassing FastAPI's response encoding."""
+    return cached_json_response(request, dump_json(adapter, data))
+
+async def _rejection(db: AsyncSession, reservation_data: RoomReservationCreate) -> HTTPException:
     """
-    Create a new room reservation.
+    Work out why a reservation insert matched no row.
+    
+    Only runs once the guarded insert has been rejected, so the success path
+    never issues these lookups.
     
     Args:
-        reservation_data: Reservation creation data
         db: Database session
+        reservation_data: Reservation creation data
         
     Returns:
-        Created reservation information
-        
-    Raises:
-        HTTPException: If room/user not found or time conflict exists
+        The HTTPException to raise
     """
     # Check if room exists
-    room = db.query(Room).filter(Room.id == reservation_data.room_id).first()
+    room = await db.get(Room, reservation_data.room_id)
     if not room:
-        raise HTTPException(
+        return HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Room not found"
         )
     
     # Check if user exists
-    user = db.query(User).filter(User.id == reservation_data.reserved_by).first()
-    if not user:
-        raise HTTPException(
+    if not await _exists(db, User, reservation_data.reserved_by):
+        return HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
     # Check if expected occupants exceed room capacity
     if reservation_data.expected_occupants > room.capacity:
-        raise HTTPException(
+        return HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Expected occupants ({reservation_data.expected_occupants}) exceed room capacity ({room.capacity})"
         )
     
-    # Check for time conflicts
-    conflicting_reservations = db.query(RoomReservation).filter(
-        RoomReservation.room_id == reservation_data.room_id,
-        RoomReservation.start_time < reservation_data.end_time,
-        RoomReservation.end_time > reservation_data.start_time
-    ).first()
-    
-    if conflicting_reservations:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Time conflict: Room is already reserved for this time period"
-        )
-    
-    # Create new reservation
-    db_reservation = RoomReservation(
-        room_id=reservation_data.room_id,
-        reserved_by=reservation_data.reserved_by,
-        start_time=reservation_data.start_time,
-        end_time=reservation_data.end_time,
-        expected_occupants=reservation_data.expected_occupants
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Time conflict: Room is already reserved for this time period"
     )
+
+@router.post("/", response_model=RoomReservationResponse, status_code=status.HTTP_201_CREATED)
+async def create_reservation(
+    reservation_data: RoomReservationCreate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Create a new room reservation.
     
-    db.add(db_reservation)
-    db.commit()
-    db.refresh(db_reservation)
-    
-    return db_reservation
+    Args:
+        reservation_data: Reservation creation data
+        db: Database session
+        
+    Returns:
+        Created reservation information
+        
+    Raises:
+        HTTPException: If room/user not found or time conflict exists
+    """
+    # Room, user, capacity and overlap are checked by the insert itself
+    values = reservation_data.model_dump()
+    db_reservation = RoomReservation(id=str(uuid4()), **values)
+    result = await db.execute(_INSERT_RESERVATION, {"reservation_id": db_reservation.id, **values})
+    if result.rowcount == 0:
+        await db.rollback()
+        raise await _rejection(db, reservation_data)
+    
+    await db.commit()
+    
+    return Response(
+        content=dump_constructed(RoomReservationResponse, db_reservation),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json"
+    )
 
-@router.get("/", response_model=List[RoomReservationResponse])
+@router.get("/", response_model=PaginatedResponse[RoomReservationResponse])
 async def get_reservations(
-    db: Session = Depends(get_db)
+    request: Request,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get all reservations.
+    Get reservations, one page at a time.
     
     Args:
+        request: Incoming request
+        skip: Number of records to skip
+        limit: Maximum number of records to return
         db: Database session
         
     Returns:
-        List of all reservations
+        Page of reservations with the total count
     """
-    # Get all reservations
-    reservations = db.query(RoomReservation).all()
+    page = await paginate(db, _SELECT_RESERVATIONS, skip, limit)
     
-    return reservations
+    return _json_response(request, RESERVATION_PAGE_ADAPTER, page)
 
 @router.get("/{reservation_id}", response_model=RoomReservationResponse)
 async def get_reservation(
-    reservation_id: str,
-    db: Session = Depends(get_db)
+    request: Request,
+    reservation_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a specific reservation by ID.
     
     Args:
+        request: Incoming request
         reservation_id: Reservation ID
         db: Database session
         
@@ -122,83 +223,95 @@ async def get_reservation(
     Raises:
         HTTPException: If reservation not found
     """
-    reservation = db.query(RoomReservation).filter(RoomReservation.id == reservation_id).first()
+    reservation = await db.get(RoomReservation, reservation_id)
     if not reservation:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Reservation not found"
         )
     
-    return reservation
+    return cached_json_response(request, dump_constructed(RoomReservationResponse, reservation))
 
-@router.get("/room/{room_id}", response_model=List[RoomReservationResponse])
+@router.get("/room/{room_id}", response_model=PaginatedResponse[RoomReservationResponse])
 async def get_room_reservations(
-    room_id: str,
-    db: Session = Depends(get_db)
+    request: Request,
+    room_id: UUID,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get all reservations for a specific room.
+    Get the reservations for a specific room, one page at a time.
     
     Args:
+        request: Incoming request
         room_id: Room ID
+        skip: Number of records to skip
+        limit: Maximum number of records to return
         db: Database session
         
     Returns:
-        List of reservations for the room
+        Page of reservations for the room with the total count
         
     Raises:
         HTTPException: If room not found
     """
     # Check if room exists
-    room = db.query(Room).filter(Room.id == room_id).first()
-    if not room:
+    if not await _exists(db, Room, room_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Room not found"
         )
     
     # Get reservations for the room
-    reservations = db.query(RoomReservation).filter(RoomReservation.room_id == room_id).all()
+    page = await paginate(db, _SELECT_ROOM_RESERVATIONS, skip, limit, {"room_id": room_id})
     
-    return reservations
+    return _json_response(request, RESERVATION_PAGE_ADAPTER, page)
 
-@router.get("/user/{user_id}", response_model=List[ExtendedRoomReservationResponse])
+@router.get("/user/{user_id}", response_model=PaginatedResponse[ExtendedRoomReservationResponse])
 async def get_user_reservations(
-    user_id: str,
-    db: Session = Depends(get_db)
+    request: Request,
+    user_id: UUID,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get all reservations made by a specific user with full room information.
+    Get the reservations made by a specific user with full room information,
+    one page at a time.
     
     Args:
+        request: Incoming request
         user_id: User ID
+        skip: Number of records to skip
+        limit: Maximum number of records to return
         db: Database session
         
     Returns:
-        List of reservations made by the user with full room details
+        Page of reservations made by the user with full room details and the total count
         
     Raises:
         HTTPException: If user not found
     """
     # Check if user exists
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    if not await _exists(db, User, user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
     # Get reservations made by the user with room information
-    reservations = db.query(RoomReservation).join(Room).filter(RoomReservation.reserved_by == user_id).all()
+    page = await paginate(db, _SELECT_USER_RESERVATIONS, skip, limit, {"user_id": user_id}, scalars=True)
     
-    return reservations
+    return _json_response(request, EXTENDED_RESERVATION_PAGE_ADAPTER, page)
 
 @router.get("/room/{room_id}/availability")
 async def check_room_availability(
-    room_id: str,
+    room_id: UUID,
     start_time: datetime,
     end_time: datetime,
-    db: Session = Depends(get_db)
+    details: bool = Query(False, description="Include the conflicting reservations"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Check if a room is available for a specific time period.
@@ -207,6 +320,7 @@ async def check_room_availability(
         room_id: Room ID
         start_time: Start time to check
         end_time: End time to check
+        details: Whether to list the conflicting reservations
         db: Database session
         
     Returns:
@@ -222,45 +336,40 @@ async def check_room_availability(
             detail="Start time must be before end time"
         )
     
-    # Check if room exists
-    room = db.query(Room).filter(Room.id == room_id).first()
-    if not room:
+    params = {"room_id": room_id, "start_time": start_time, "end_time": end_time}
+    
+    # Check if room exists and whether any booking overlaps, in one query
+    room = (await db.execute(_SELECT_ROOM_AVAILABILITY, params)).first()
+    if room is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Room not found"
         )
     
-    # Check for conflicting reservations
-    conflicting_reservations = db.query(RoomReservation).filter(
-        RoomReservation.room_id == room_id,
-        RoomReservation.start_time < end_time,
-        RoomReservation.end_time > start_time
-    ).all()
-    
-    is_available = len(conflicting_reservations) == 0
-    
-    return {
+    availability = {
         "room_id": room_id,
         "room_name": room.name,
         "start_time": start_time,
         "end_time": end_time,
-        "is_available": is_available,
-        "conflicting_reservations": [
-            {
-                "id": res.id,
-                "start_time": res.start_time,
-                "end_time": res.end_time,
-                "reserved_by": res.reserved_by
-            }
-            for res in conflicting_reservations
-        ]
+        "is_available": not room.booked
     }
+    if not details:
+        return availability
+    
+    # Only fetch the conflicting reservations when they were asked for
+    conflicting_reservations = []
+    if room.booked:
+        conflicting_reservations = (await db.execute(_SELECT_OVERLAPPING, params)).all()
+    
+    # The projected rows carry exactly the fields reported per conflict
+    availability["conflicting_reservations"] = [res._asdict() for res in conflicting_reservations]
+    return availability
 
 @router.put("/{reservation_id}", response_model=RoomReservationResponse)
 async def update_reservation(
-    reservation_id: str,
+    reservation_id: UUID,
     reservation_data: RoomReservationUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update a reservation.
@@ -276,15 +385,16 @@ async def update_reservation(
     Raises:
         HTTPException: If reservation not found or time conflict exists
     """
-    reservation = db.query(RoomReservation).filter(RoomReservation.id == reservation_id).first()
-    if not reservation:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Reservation not found"
-        )
-    
-    # Check for time conflicts if time is being updated
+    # Check for time conflicts if time is being updated; only then is the
+    # stored row needed up front
     if reservation_data.start_time or reservation_data.end_time:
+        reservation = await db.get(RoomReservation, reservation_id)
+        if not reservation:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Reservation not found"
+            )
+        
         start_time = reservation_data.start_time or reservation.start_time
         end_time = reservation_data.end_time or reservation.end_time
         
@@ -294,33 +404,41 @@ async def update_reservation(
                 detail="Start time must be before end time"
             )
         
-        conflicting_reservations = db.query(RoomReservation).filter(
-            RoomReservation.room_id == reservation.room_id,
-            RoomReservation.id != reservation_id,
-            RoomReservation.start_time < end_time,
-            RoomReservation.end_time > start_time
-        ).first()
+        has_conflict = await db.scalar(_OTHER_OVERLAP, {
+            "room_id": reservation.room_id,
+            "reservation_id": reservation_id,
+            "start_time": start_time,
+            "end_time": end_time
+        })
         
-        if conflicting_reservations:
+        if has_conflict:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Time conflict: Room is already reserved for this time period"
             )
     
-    # Update reservation fields
-    update_data = reservation_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(reservation, field, value)
+    update_data = reservation_data.model_dump(exclude_unset=True)
+    if update_data:
+        # UPDATE by primary key instead of flushing attribute changes
+        await db.execute(
+            update(RoomReservation).where(RoomReservation.id == reservation_id).values(**update_data)
+        )
+        await db.commit()
     
-    db.commit()
-    db.refresh(reservation)
+    # populate_existing: the row may already be in the session from the conflict check
+    reservation = await db.get(RoomReservation, reservation_id, populate_existing=True)
+    if not reservation:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Reservation not found"
+        )
     
-    return reservation
+    return Response(content=dump_constructed(RoomReservationResponse, reservation), media_type="application/json")
 
 @router.delete("/{reservation_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_reservation(
-    reservation_id: str,
-    db: Session = Depends(get_db)
+    reservation_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete a reservation.
@@ -332,21 +450,21 @@ async def delete_reservation(
     Raises:
         HTTPException: If reservation not found
     """
-    reservation = db.query(RoomReservation).filter(RoomReservation.id == reservation_id).first()
+    reservation = await db.get(RoomReservation, reservation_id)
     if not reservation:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Reservation not found"
         )
     
-    db.delete(reservation)
-    db.commit()
+    await db.delete(reservation)
+    await db.commit()
     
     return None
 
 @router.get("/stats/summary")
 async def get_reservation_stats(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get reservation statistics summary.
@@ -357,35 +475,14 @@ async def get_reservation_stats(
     Returns:
         Reservation statistics summary
     """
-    # Get total reservations
-    total_reservations = db.query(RoomReservation).count()
-    
-    # Get active reservations (future reservations)
-    now = datetime.utcnow()
-    active_reservations = db.query(RoomReservation).filter(
-        RoomReservation.start_time > now
-    ).count()
-    
-    # Get past reservations
-    past_reservations = db.query(RoomReservation).filter(
-        RoomReservation.end_time < now
-    ).count()
-    
-    # Get current reservations
-    current_reservations = db.query(RoomReservation).filter(
-        RoomReservation.start_time <= now,
-        RoomReservation.end_time >= now
-    ).count()
-    
-    # Get total expected occupants
-    total_occupants = db.query(RoomReservation).with_entities(
-        db.func.sum(RoomReservation.expected_occupants)
-    ).scalar() or 0
+    # Reservation times are stored as naive UTC DATETIME values
+    now = utcnow()
+    stats = (await db.execute(_RESERVATION_STATS, {"now": now})).one()
     
     return {
-        "total_reservations": total_reservations,
-        "active_reservations": active_reservations,
-        "past_reservations": past_reservations,
-        "current_reservations": current_reservations,
-        "total_expected_occupants": total_occupants
+        "total_reservations": stats.total,
+        "active_reservations": stats.active,
+        "past_reservations": stats.past,
+        "current_reservations": stats.current,
+        "total_expected_occupants": stats.occupants
     } 
\ No newline at end of file
@@ -3,23 +3,51 @@ Rooms router for Campus Access Management System.
 Handles room CRUD operations and management.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import bindparam, case, distinct, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
 
-from app.models.base import get_db
+from app.models.base import get_async_db, paginate
 from app.models.database_models import Room
 from app.models.schemas import (
     RoomCreate, RoomUpdate, RoomResponse,
-    PaginationParams, PaginatedResponse, ErrorResponse
+    PaginatedResponse,
+    ROOM_PAGE_ADAPTER, dump_json, dump_constructed
 )
+from app.routers._http import cached_json_response
 
 router = APIRouter()
 
+# List endpoints project only the columns RoomResponse serializes
+_ROOM_COLUMNS = (Room.id, Room.name, Room.location, Room.capacity)
+_SELECT_ROOMS = select(*_ROOM_COLUMNS).order_by(Room.id)
+_SELECT_ROOMS_BY_LOCATION = (
+    select(*_ROOM_COLUMNS).where(Room.location == bindparam("location")).order_by(Room.id)
+)
+_SELECT_ROOMS_BY_MIN_CAPACITY = (
+    select(*_ROOM_COLUMNS).where(Room.capacity >= bindparam("min_capacity")).order_by(Room.id)
+)
+
+# Totals, capacity figures and size buckets in a single scan
+_ROOM_STATS = select(
+    func.count().label("total"),
+    func.coalesce(func.sum(Room.capacity), 0).label("total_capacity"),
+    func.coalesce(func.avg(Room.capacity), 0).label("average_capacity"),
+    func.count(distinct(Room.location)).label("locations"),
+    func.coalesce(func.sum(case((Room.capacity < 20, 1), else_=0)), 0).label("small"),
+    func.coalesce(func.sum(case(((Room.capacity >= 20) & (Room.capacity < 50), 1), else_=0)), 0).label("medium"),
+    func.coalesce(func.sum(case((Room.capacity >= 50, 1), else_=0)), 0).label("large"),
+)
+
+def _rooms_response(request: Request, page) -> Response:
+    """Serialize a page of rooms in one pydantic-core pass, bypassing FastAPI's response encoding."""
+    return cached_json_response(request, dump_json(ROOM_PAGE_ADAPTER, page))
+
 @router.post("/", response_model=RoomResponse, status_code=status.HTTP_201_CREATED)
 async def create_room(
     room_data: RoomCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a new room.
@@ -39,38 +67,49 @@ async def create_room(
     )
     
     db.add(db_room)
-    db.commit()
-    db.refresh(db_room)
+    await db.commit()
+    await db.refresh(db_room)
     
-    return db_room
+    return Response(
+        content=dump_constructed(RoomResponse, db_room),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json"
+    )
 
-@router.get("/", response_model=List[RoomResponse])
+@router.get("/", response_model=PaginatedResponse[RoomResponse])
 async def get_rooms(
-    db: Session = Depends(get_db)
+    request: Request,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get all rooms.
+    Get rooms, one page at a time.
     
     Args:
+        request: Incoming request
+        skip: Number of records to skip
+        limit: Maximum number of records to return
         db: Database session
         
     Returns:
-        List of all rooms
+        Page of rooms with the total count
     """
-    # Get all rooms
-    rooms = db.query(Room).all()
+    page = await paginate(db, _SELECT_ROOMS, skip, limit)
     
-    return rooms
+    return _rooms_response(request, page)
 
 @router.get("/{room_id}", response_model=RoomResponse)
 async def get_room(
-    room_id: str,
-    db: Session = Depends(get_db)
+    request: Request,
+    room_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a specific room by ID.
     
     Args:
+        request: Incoming request
         room_id: Room ID
         db: Database session
         
@@ -80,47 +119,59 @@ async def get_room(
     Raises:
         HTTPException: If room not found
     """
-    room = db.query(Room).filter(Room.id == room_id).first()
+    room = await db.get(Room, room_id)
     if not room:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Room not found"
         )
     
-    return room
+    return cached_json_response(request, dump_constructed(RoomResponse, room))
 
-@router.get("/location/{location}", response_model=List[RoomResponse])
+@router.get("/location/{location}", response_model=PaginatedResponse[RoomResponse])
 async def get_rooms_by_location(
+    request: Request,
     location: str,
-    db: Session = Depends(get_db)
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get all rooms in a specific location.
+    Get the rooms in a specific location, one page at a time.
     
     Args:
+        request: Incoming request
         location: Room location
+        skip: Number of records to skip
+        limit: Maximum number of records to return
         db: Database session
         
     Returns:
-        List of rooms in the location
+        Page of rooms in the location with the total count
     """
-    rooms = db.query(Room).filter(Room.location == location).all()
-    return rooms
+    page = await paginate(db, _SELECT_ROOMS_BY_LOCATION, skip, limit, {"location": location})
+    return _rooms_response(request, page)
 
-@router.get("/capacity/{min_capacity}", response_model=List[RoomResponse])
+@router.get("/capacity/{min_capacity}", response_model=PaginatedResponse[RoomResponse])
 async def get_rooms_by_min_capacity(
+    request: Request,
     min_capacity: int,
-    db: Session = Depends(get_db)
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get all rooms with minimum capacity.
+    Get the rooms with a minimum capacity, one page at a time.
     
     Args:
+        request: Incoming request
         min_capacity: Minimum room capacity
+        skip: Number of records to skip
+        limit: Maximum number of records to return
         db: Database session
         
     Returns:
-        List of rooms with minimum capacity
+        Page of rooms with minimum capacity and the total count
         
     Raises:
         HTTPException: If minimum capacity is negative
@@ -131,14 +182,14 @@ async def get_rooms_by_min_capacity(
             detail="Minimum capacity must be non-negative"
         )
     
-    rooms = db.query(Room).filter(Room.capacity >= min_capacity).all()
-    return rooms
+    page = await paginate(db, _SELECT_ROOMS_BY_MIN_CAPACITY, skip, limit, {"min_capacity": min_capacity})
+    return _rooms_response(request, page)
 
 @router.put("/{room_id}", response_model=RoomResponse)
 async def update_room(
-    room_id: str,
+    room_id: UUID,
     room_data: RoomUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update a room.
@@ -154,27 +205,25 @@ async def update_room(
     Raises:
         HTTPException: If room not found
     """
-    room = db.query(Room).filter(Room.id == room_id).first()
+    update_data = room_data.model_dump(exclude_unset=True)
+    if update_data:
+        # UPDATE by primary key without loading the row first
+        await db.execute(update(Room).where(Room.id == room_id).values(**update_data))
+        await db.commit()
+    
+    room = await db.get(Room, room_id)
     if not room:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Room not found"
         )
     
-    # Update room fields
-    update_data = room_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(room, field, value)
-    
-    db.commit()
-    db.refresh(room)
-    
-    return room
+    return Response(content=dump_constructed(RoomResponse, room), media_type="application/json")
 
 @router.delete("/{room_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_room(
-    room_id: str,
-    db: Session = Depends(get_db)
+    room_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete a room.
@@ -186,21 +235,21 @@ async def delete_room(
     Raises:
         HTTPException: If room not found
     """
-    room = db.query(Room).filter(Room.id == room_id).first()
+    room = await db.get(Room, room_id)
     if not room:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Room not found"
         )
     
-    db.delete(room)
-    db.commit()
+    await db.delete(room)
+    await db.commit()
     
     return None
 
 @router.get("/stats/summary")
 async def get_room_stats(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get room statistics summary.
@@ -211,35 +260,16 @@ async def get_room_stats(
     Returns:
         Room statistics summary
     """
-    # Get total rooms
-    total_rooms = db.query(Room).count()
-    
-    # Get total capacity
-    total_capacity = db.query(Room).with_entities(
-        db.func.sum(Room.capacity)
-    ).scalar() or 0
-    
-    # Get average capacity
-    avg_capacity = db.query(Room).with_entities(
-        db.func.avg(Room.capacity)
-    ).scalar() or 0
-    
-    # Get unique locations
-    unique_locations = db.query(Room.location).distinct().count()
-    
-    # Get rooms by capacity range
-    small_rooms = db.query(Room).filter(Room.capacity < 20).count()
-    medium_rooms = db.query(Room).filter(Room.capacity >= 20, Room.capacity < 50).count()
-    large_rooms = db.query(Room).filter(Room.capacity >= 50).count()
+    stats = (await db.execute(_ROOM_STATS)).one()
     
     return {
-        "total_rooms": total_rooms,
-        "total_capacity": total_capacity,
-        "average_capacity": round(avg_capacity, 2),
-        "unique_locations": unique_locations,
+        "total_rooms": stats.total,
+        "total_capacity": stats.total_capacity,
+        "average_capacity": round(stats.average_capacity, 2),
+        "unique_locations": stats.locations,
         "capacity_distribution": {
-            "small_rooms_less_than_20": small_rooms,
-            "medium_rooms_20_to_50": medium_rooms,
-            "large_rooms_50_plus": large_rooms
+            "small_rooms_less_than_20": stats.small,
+            "medium_rooms_20_to_50": stats.medium,
+            "large_rooms_50_plus": stats.large
         }
     } 
\ No newline at end of file
@@ -3,23 +3,79 @@ Students router for Campus Access Management System.
 Handles student profile CRUD operations and management.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import bindparam, delete, exists, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
 
-from app.models.base import get_db
+from app.models.base import get_async_db, is_foreign_key_violation, paginate, violated_column
 from app.models.database_models import Student, User
 from app.models.schemas import (
     StudentCreate, StudentUpdate, StudentResponse,
-    PaginationParams, PaginatedResponse, ErrorResponse
+    PaginatedResponse,
+    STUDENT_PAGE_ADAPTER, dump_json
 )
+from app.routers._http import cached_json_response
 
 router = APIRouter()
 
+# Statements are built once; SQLAlchemy caches their compiled form
+# List endpoints project only the columns StudentResponse serializes
+_STUDENT_COLUMNS = (
+    Student.id, Student.user_id, Student.full_name, Student.student_card_id,
+    Student.email, Student.class_name, Student.phone_number, Student.registered_at
+)
+_SELECT_STUDENTS = select(*_STUDENT_COLUMNS).order_by(Student.id)
+_SELECT_STUDENT_BY_USER = select(Student).where(Student.user_id == bindparam("user_id"))
+_SELECT_STUDENTS_BY_CLASS_NAME = (
+    select(*_STUDENT_COLUMNS).where(Student.class_name == bindparam("class_name")).order_by(Student.id)
+)
+
+# User row plus whether it already has a profile, checked before an insert
+_CREATE_CHECKS = select(
+    User.id,
+    exists().where(Student.user_id == bindparam("user_id")).label("has_profile")
+).where(User.id == bindparam("user_id"))
+
+# Stats summary: one aggregate row plus the per-class name breakdown. The
+# number of distinct values comes from the GROUP BY rows, so no
+# COUNT(DISTINCT) is issued
+_STUDENT_TOTALS = select(
+    func.count().label("total"),
+    func.count(Student.phone_number).label("with_phone")
+)
+_STUDENTS_PER_CLASS_NAME = select(Student.class_name, func.count().label("count")).group_by(Student.class_name)
+
+# Unique columns and the error reported when a write collides with them
+_UNIQUE_VIOLATIONS = {
+    "student_card_id": "Student with this card ID already exists",
+    "email": "Student with this email already exists",
+    "user_id": "User already has a student profile",
+}
+
+def _conflict(error: IntegrityError) -> HTTPException:
+    """
+    Map an IntegrityError on students: a missing user to a 404, a
+    unique-constraint violation to a 400.
+    """
+    # The user was deleted after the existence check; checked first since
+    # the foreign key message also names user_id
+    if is_foreign_key_violation(error):
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    column = violated_column(error, _UNIQUE_VIOLATIONS)
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=_UNIQUE_VIOLATIONS.get(column, "Student with this email or card ID already exists")
+    )
+
 @router.post("/", response_model=StudentResponse, status_code=status.HTTP_201_CREATED)
 async def create_student(
     student_data: StudentCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a new student profile.
@@ -34,38 +90,20 @@ async def create_student(
     Raises:
         HTTPException: If user not found or email/student_card_id already exists
     """
-    # Check if user exists
-    user = db.query(User).filter(User.id == student_data.user_id).first()
-    if not user:
+    # Fetch the user and its existing-profile flag in a single round-trip;
+    # email and card ID uniqueness is enforced by the database on commit
+    checks = (await db.execute(_CREATE_CHECKS, {"user_id": student_data.user_id})).first()
+    if checks is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-    
-    # Check if user already has a student profile
-    existing_student = db.query(Student).filter(Student.user_id == student_data.user_id).first()
-    if existing_student:
+    if checks.has_profile:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User already has a student profile"
         )
     
-    # Check if email already exists
-    existing_email = db.query(Student).filter(Student.email == student_data.email).first()
-    if existing_email:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Student with this email already exists"
-        )
-    
-    # Check if student card ID already exists
-    existing_card = db.query(Student).filter(Student.student_card_id == student_data.student_card_id).first()
-    if existing_card:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Student with this card ID already exists"
-        )
-    
     # Create new student profile
     db_student = Student(
         user_id=student_data.user_id,
@@ -77,33 +115,41 @@ async def create_student(
     )
     
     db.add(db_student)
-    db.commit()
-    db.refresh(db_student)
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        raise _conflict(e)
     
     return db_student
 
-@router.get("/", response_model=List[StudentResponse])
+@router.get("/", response_model=PaginatedResponse[StudentResponse])
 async def get_students(
-    db: Session = Depends(get_db)
+    request: Request,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get all students.
+    Get students, one page at a time.
     
     Args:
+        request: Incoming request
+        skip: Number of records to skip
+        limit: Maximum number of records to return
         db: Database session
         
     Returns:
-        List of all students
+        Page of students with the total count
     """
-    # Get all students
-    students = db.query(Student).all()
-    
-    return students
+    # Clients revalidate with the ETag; unchanged pages cost a 304
+    page = await paginate(db, _SELECT_STUDENTS, skip, limit)
+    return cached_json_response(request, dump_json(STUDENT_PAGE_ADAPTER, page))
 
 @router.get("/{student_id}", response_model=StudentResponse)
 async def get_student(
-    student_id: str,
-    db: Session = Depends(get_db)
+    student_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a specific student by ID.
@@ -118,7 +164,7 @@ async def get_student(
     Raises:
         HTTPException: If student not found
     """
-    student = db.query(Student).filter(Student.id == student_id).first()
+    student = await db.get(Student, student_id)
     if not student:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -129,8 +175,8 @@ async def get_student(
 
 @router.get("/user/{user_id}", response_model=StudentResponse)
 async def get_student_by_user_id(
-    user_id: str,
-    db: Session = Depends(get_db)
+    user_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get student profile by user ID.
@@ -145,7 +191,7 @@ async def get_student_by_user_id(
     Raises:
         HTTPException: If student not found
     """
-    student = db.query(Student).filter(Student.user_id == user_id).first()
+    student = await db.scalar(_SELECT_STUDENT_BY_USER, {"user_id": user_id})
     if not student:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -154,29 +200,35 @@ async def get_student_by_user_id(
     
     return student
 
-@router.get("/class/{class_name}", response_model=List[StudentResponse])
+@router.get("/class/{class_name}", response_model=PaginatedResponse[StudentResponse])
 async def get_students_by_class(
     class_name: str,
-    db: Session = Depends(get_db)
+    request: Request,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get all students in a specific class.
+    Get students in a specific class, one page at a time.
     
     Args:
         class_name: Class name
+        request: Incoming request
+        skip: Number of records to skip
+        limit: Maximum number of records to return
         db: Database session
         
     Returns:
-        List of students in the class
+        Page of students in the class with the total count
     """
-    students = db.query(Student).filter(Student.class_name == class_name).all()
-    return students
+    page = await paginate(db, _SELECT_STUDENTS_BY_CLASS_NAME, skip, limit, {"class_name": class_name})
+    return cached_json_response(request, dump_json(STUDENT_PAGE_ADAPTER, page))
 
 @router.put("/{student_id}", response_model=StudentResponse)
 async def update_student(
-    student_id: str,
+    student_id: UUID,
     student_data: StudentUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update a student profile.
@@ -192,45 +244,29 @@ async def update_student(
     Raises:
         HTTPException: If student not found or email/student_card_id already exists
     """
-    student = db.query(Student).filter(Student.id == student_id).first()
+    update_data = student_data.model_dump(exclude_unset=True)
+    if update_data:
+        # UPDATE by primary key without loading the row first
+        try:
+            await db.execute(update(Student).where(Student.id == student_id).values(**update_data))
+            await db.commit()
+        except IntegrityError as e:
+            await db.rollback()
+            raise _conflict(e)
+    
+    student = await db.get(Student, student_id)
     if not student:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Student not found"
         )
     
-    # Check if email is being updated and if it already exists
-    if student_data.email and student_data.email != student.email:
-        existing_email = db.query(Student).filter(Student.email == student_data.email).first()
-        if existing_email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Student with this email already exists"
-            )
-    
-    # Check if student card ID is being updated and if it already exists
-    if student_data.student_card_id and student_data.student_card_id != student.student_card_id:
-        existing_card = db.query(Student).filter(Student.student_card_id == student_data.student_card_id).first()
-        if existing_card:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Student with this card ID already exists"
-            )
-    
-    # Update student fields
-    update_data = student_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(student, field, value)
-    
-    db.commit()
-    db.refresh(student)
-    
     return student
 
 @router.delete("/{student_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_student(
-    student_id: str,
-    db: Session = Depends(get_db)
+    student_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete a student profile.
@@ -242,21 +278,20 @@ async def delete_student(
     Raises:
         HTTPException: If student not found
     """
-    student = db.query(Student).filter(Student.id == student_id).first()
-    if not student:
+    # Single DELETE without loading the row first
+    result = await db.execute(delete(Student).where(Student.id == student_id))
+    if not result.rowcount:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Student not found"
         )
-    
-    db.delete(student)
-    db.commit()
+    await db.commit()
     
     return None
 
 @router.get("/stats/summary")
 async def get_student_stats(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get student statistics summary.
@@ -267,27 +302,17 @@ async def get_student_stats(
     Returns:
         Student statistics summary
     """
-    # Get total students
-    total_students = db.query(Student).count()
-    
-    # Get unique classes
-    unique_classes = db.query(Student.class_name).distinct().count()
-    
-    # Get students by class
-    class_counts = db.query(
-        Student.class_name,
-        db.func.count(Student.id).label('count')
-    ).group_by(Student.class_name).all()
+    totals = (await db.execute(_STUDENT_TOTALS)).one()
+    class_counts = (await db.execute(_STUDENTS_PER_CLASS_NAME)).all()
     
-    # Get students with phone numbers
-    students_with_phone = db.query(Student).filter(Student.phone_number.isnot(None)).count()
+    unique_classes = len(class_counts)
     
     return {
-        "total_students": total_students,
+        "total_students": totals.total,
         "unique_classes": unique_classes,
-        "students_with_phone": students_with_phone,
+        "students_with_phone": totals.with_phone,
         "class_distribution": [
             {"class_name": class_name, "count": count}
             for class_name, count in class_counts
         ]
-    } 
\ No newline at end of file
+    }
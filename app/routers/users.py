@@ -3,20 +3,36 @@ Users router for Campus Access Management System.
 Handles user CRUD operations and authentication.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
 import bcrypt
 
-from app.models.base import get_db
-from app.models.database_models import User, UserRole as UserRoleModel
+from app.config.settings import get_settings
+from app.models.base import get_async_db, paginate
+from app.models.database_models import AccessCard, AccessLog, User
 from app.models.schemas import (
-    UserCreate, UserUpdate, UserResponse, 
-    PaginationParams, PaginatedResponse, ErrorResponse
+    UserCreate, UserUpdate, UserPasswordUpdate, UserResponse, 
+    PaginatedResponse,
+    USER_PAGE_ADAPTER, dump_json
 )
+from app.routers.authentication import BCRYPT_PREFIXES, bcrypt_pool, forget_verified_login, get_current_user
 
 router = APIRouter()
 
+# Built once; the list endpoint skips password_hash and timestamps UserResponse never returns
+_SELECT_USERS = select(User.id, User.email, User.role).order_by(User.id)
+
+# Access logs of a user's cards; the schema would only set their card_id to
+# NULL when the cards are cascaded away
+_DELETE_USER_LOGS = delete(AccessLog).where(
+    AccessLog.card_id.in_(select(AccessCard.id).where(AccessCard.user_id == bindparam("user_id")))
+)
+
 def hash_password(password: str) -> str:
     """
     Hash a password using bcrypt.
@@ -27,7 +43,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=get_settings().bcrypt_rounds)
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
@@ -42,12 +58,15 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
+    # Anything that is not a bcrypt hash can never match; skip the slow path
+    if not hashed_password.startswith(BCRYPT_PREFIXES):
+        return False
     return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def create_user(
     user_data: UserCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a new user.
@@ -62,16 +81,9 @@ async def create_user(
     Raises:
         HTTPException: If email already exists
     """
-    # Check if user with email already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User with this email already exists"
-        )
-    
-    # Hash the password
-    hashed_password = hash_password(user_data.password)
+    # Hash the password on the dedicated bcrypt pool, off the event loop
+    loop = asyncio.get_running_loop()
+    hashed_password = await loop.run_in_executor(bcrypt_pool, hash_password, user_data.password)
     
     # Create new user
     db_user = User(
@@ -81,33 +93,42 @@ async def create_user(
     )
     
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # users.email is unique; let the database reject duplicates
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User with this email already exists"
+        )
     
     return db_user
 
-@router.get("/", response_model=List[UserResponse])
+@router.get("/", response_model=PaginatedResponse[UserResponse])
 async def get_users(
-    db: Session = Depends(get_db)
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get all users.
+    Get users, one page at a time.
     
     Args:
+        skip: Number of records to skip
+        limit: Maximum number of records to return
         db: Database session
         
     Returns:
-        List of all users
+        Page of users with the total count
     """
-    # Get all users
-    users = db.query(User).all()
-    
-    return users
+    page = await paginate(db, _SELECT_USERS, skip, limit)
+    return Response(content=dump_json(USER_PAGE_ADAPTER, page), media_type="application/json")
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
-    user_id: str,
-    db: Session = Depends(get_db)
+    user_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a specific user by ID.
@@ -122,7 +143,7 @@ async def get_user(
     Raises:
         HTTPException: If user not found
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -133,9 +154,9 @@ async def get_user(
 
 @router.put("/{user_id}", response_model=UserResponse)
 async def update_user(
-    user_id: str,
+    user_id: UUID,
     user_data: UserUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update a user.
@@ -151,39 +172,80 @@ async def update_user(
     Raises:
         HTTPException: If user not found or email already exists
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    update_data = user_data.model_dump(exclude_unset=True)
+    if update_data:
+        # UPDATE by primary key without loading the row first
+        try:
+            await db.execute(update(User).where(User.id == user_id).values(**update_data))
+            await db.commit()
+        except IntegrityError:
+            # users.email is unique; let the database reject duplicates
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User with this email already exists"
+            )
+    
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    # Check if email is being updated and if it already exists
-    if user_data.email and user_data.email != user.email:
-        existing_user = db.query(User).filter(User.email == user_data.email).first()
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="User with this email already exists"
-            )
+    return user
+
+@router.patch("/{user_id}/password", status_code=status.HTTP_204_NO_CONTENT)
+async def update_user_password(
+    user_id: UUID,
+    password_data: UserPasswordUpdate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Change a user's password.
+    
+    Kept apart from the general update so metadata edits never pay for bcrypt.
+    Users may change their own password; admins may change anyone's. Tokens
+    issued before the change stop working.
+    
+    Args:
+        user_id: User ID
+        password_data: New password
+        current_user: Current authenticated user (from token)
+        db: Database session
+        
+    Raises:
+        HTTPException: If the caller may not change this password or user not found
+    """
+    if current_user.role.value != "admin" and current_user.id != str(user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not allowed to change this user's password"
+        )
     
-    # Update user fields
-    update_data = user_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(user, field, value)
+    user = await db.get(User, user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
     
-    db.commit()
-    db.refresh(user)
+    loop = asyncio.get_running_loop()
+    user.password_hash = await loop.run_in_executor(bcrypt_pool, hash_password, password_data.password)
+    await db.commit()
+    # The old password must not be accepted from the login cache either
+    forget_verified_login(user.email)
     
-    return user
+    return None
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
-    user_id: str,
-    db: Session = Depends(get_db)
+    user_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Delete a user.
+    Delete a user, with their access cards and the cards' access logs.
     
     Args:
         user_id: User ID
@@ -192,14 +254,15 @@ async def delete_user(
     Raises:
         HTTPException: If user not found
     """
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    # The database cascades to dependent rows, except access logs, which it
+    # would keep with a NULL card
+    await db.execute(_DELETE_USER_LOGS, {"user_id": user_id})
+    result = await db.execute(delete(User).where(User.id == user_id))
+    if not result.rowcount:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-    
-    db.delete(user)
-    db.commit()
+    await db.commit()
     
     return None 
\ No newline at end of file
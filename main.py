@@ -3,29 +3,58 @@ Main FastAPI application entry point for Campus Access Management System.
 This file contains the FastAPI app instance and basic configuration.
 """
 
+import asyncio
 import logging
-from fastapi import FastAPI
+import orjson
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 # Import routers
-from app.routers import health, users, access_cards, access_logs, rooms, reservations, students, professors, authentication
-from app.config.settings import APP_NAME, APP_VERSION, CORS_ORIGINS, CORS_ALLOW_CREDENTIALS, CORS_ALLOW_METHODS, CORS_ALLOW_HEADERS
+from app.routers import register_routers
+from app.config.settings import APP_NAME, APP_VERSION, ENVIRONMENT, LOG_LEVEL, DB_POOL_WARM_SIZE, CORS_ORIGINS, CORS_ALLOW_CREDENTIALS, CORS_ALLOW_METHODS, CORS_ALLOW_HEADERS, CORS_MAX_AGE
 
 # Import database migration
-from app.database.migrations import run_migrations, initialize_sample_data
+from app.bootstrap import preload
+from app.models.base import warm_connection_pool
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(
+    level=LOG_LEVEL.upper(),
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Run database migrations and initialization on application startup.
+    """
+    logger.info("Starting Campus Access Management System...")
+    # Migrations use the blocking engine and run in a worker thread while
+    # the request pool's connections are opened on the event loop
+    await asyncio.gather(
+        run_in_threadpool(preload),
+        warm_connection_pool(DB_POOL_WARM_SIZE),
+    )
+    yield
+
+# The OpenAPI schema and docs pages are not served in production
+_DOCS_ENABLED = ENVIRONMENT != "prod"
+
 # Create FastAPI app instance
 app = FastAPI(
     title=APP_NAME,
     description="Internal API for campus access control, room reservations, and user management",
     version=APP_VERSION,
-    docs_url="/docs",
-    redoc_url="/redoc",
+    docs_url="/docs" if _DOCS_ENABLED else None,
+    redoc_url="/redoc" if _DOCS_ENABLED else None,
+    openapi_url="/openapi.json" if _DOCS_ENABLED else None,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Configure CORS middleware
@@ -35,38 +64,34 @@ app.add_middleware(
     allow_credentials=CORS_ALLOW_CREDENTIALS,
     allow_methods=CORS_ALLOW_METHODS,
     allow_headers=CORS_ALLOW_HEADERS,
+    max_age=CORS_MAX_AGE,
 )
 
+# Compress larger JSON bodies (list pages); small responses are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Include routers
-app.include_router(health.router, prefix="/api/v1", tags=["health"])
-app.include_router(users.router, prefix="/api/v1/users", tags=["users"])
-app.include_router(access_cards.router, prefix="/api/v1/access-cards", tags=["access-cards"])
-app.include_router(access_logs.router, prefix="/api/v1/access-logs", tags=["access-logs"])
-app.include_router(rooms.router, prefix="/api/v1/rooms", tags=["rooms"])
-app.include_router(reservations.router, prefix="/api/v1/reservations", tags=["reservations"])
-app.include_router(students.router, prefix="/api/v1/students", tags=["students"])
-app.include_router(professors.router, prefix="/api/v1/professors", tags=["professors"])
-app.include_router(authentication.router, prefix="/api/v1/auth", tags=["auth"])
+register_routers(app)
 
-@app.on_event("startup")
-async def startup_event():
-    """
-    Run database migrations and initialization on application startup.
-    """
-    logger.info("Starting Campus Access Management System...")
-    
-    # Run database migrations
-    logger.info("Running database migrations...")
-    migration_success = run_migrations()
-    
-    if migration_success:
-        logger.info("Database migrations completed successfully")
-        # Check sample data
-        initialize_sample_data()
-    else:
-        logger.error("Database migrations failed. Application may not function correctly.")
-        # Note: We don't exit here to allow the app to start even if migrations fail
-        # This is useful for development and testing scenarios
+# Root endpoint payload; constant for the process, so serialized once
+_ROOT_BODY = orjson.dumps({
+    "message": f"Welcome to {APP_NAME}!",
+    "description": "A comprehensive API for managing campus access control, room reservations, and user profiles",
+    "version": APP_VERSION,
+    # Documentation links only when the docs are served (not in prod)
+    **({"docs": app.docs_url, "redoc": app.redoc_url} if _DOCS_ENABLED else {}),
+    "health": "/api/v1/health",
+    "endpoints": {
+        "auth": "/api/v1/auth",
+        "users": "/api/v1/users",
+        "access_cards": "/api/v1/access-cards",
+        "access_logs": "/api/v1/access-logs",
+        "rooms": "/api/v1/rooms",
+        "reservations": "/api/v1/reservations",
+        "students": "/api/v1/students",
+        "professors": "/api/v1/professors"
+    }
+})
 
 # Root endpoint
 @app.get("/")
@@ -74,52 +99,36 @@ async def root():
     """
     Root endpoint that returns a welcome message and API information.
     """
-    return JSONResponse(
-        content={
-            "message": f"Welcome to {APP_NAME}!",
-            "description": "A comprehensive API for managing campus access control, room reservations, and user profiles",
-            "version": APP_VERSION,
-            "docs": "/docs",
-            "redoc": "/redoc",
-            "health": "/api/v1/health",
-            "endpoints": {
-                "auth": "/api/v1/auth",
-                "users": "/api/v1/users",
-                "access_cards": "/api/v1/access-cards",
-                "access_logs": "/api/v1/access-logs",
-                "rooms": "/api/v1/rooms",
-                "reservations": "/api/v1/reservations",
-                "students": "/api/v1/students",
-                "professors": "/api/v1/professors"
-            }
-        },
-        status_code=200
-    )
+    return Response(content=_ROOT_BODY, media_type="application/json")
+
+# Body for unhandled errors, serialized once; details only go to the logs
+_INTERNAL_ERROR_BODY = orjson.dumps({"error": "Internal server error"})
 
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """
     Global exception handler for unhandled exceptions.
+    Logs the traceback and returns a generic error without exception details.
     """
-    return JSONResponse(
-        content={
-            "error": "Internal server error",
-            "message": str(exc)
-        },
-        status_code=500
-    )
+    logger.error("Unhandled error on %s %s", request.method, request.url.path, exc_info=exc)
+    return Response(content=_INTERNAL_ERROR_BODY, status_code=500, media_type="application/json")
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    from app.config.settings import HOST, PORT, DEBUG, LOG_LEVEL
+    from app.config.settings import HOST, PORT, DEBUG, WORKERS, ACCESS_LOG, LIMIT_CONCURRENCY, BACKLOG
+    
+    # Log startup information
+    logger.info(
+        "Starting %s v%s on http://%s:%s (docs: /docs, health: /api/v1/health)",
+        APP_NAME, APP_VERSION, HOST, PORT
+    )
     
-    # Print startup information
-    print(f"Starting {APP_NAME} v{APP_VERSION}")
-    print(f"Server will be available at: http://{HOST}:{PORT}")
-    print(f"API Documentation: http://{HOST}:{PORT}/docs")
-    print(f"Health Check: http://{HOST}:{PORT}/api/v1/health")
-    print("-" * 50)
+    workers = 1 if DEBUG else WORKERS  # Reload only works with a single process
+    if workers > 1:
+        # Migrate once here instead of racing on DDL in every worker
+        preload()
     
     # Run the application with uvicorn
     uvicorn.run(
@@ -127,6 +136,12 @@ if __name__ == "__main__":
         host=HOST,
         port=PORT,
         reload=DEBUG,  # Enable auto-reload for development
+        workers=workers,
+        limit_concurrency=LIMIT_CONCURRENCY,
+        backlog=BACKLOG,
+        # uvicorn[standard] installs uvloop everywhere except Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         log_level=LOG_LEVEL.lower(),
-        access_log=True
+        access_log=ACCESS_LOG
     ) 
\ No newline at end of file
@@ -15,7 +15,7 @@ from app.database.migrations import (
     check_database_connection,
     get_existing_tables,
     run_migrations,
-    check_table_data,
+    check_tables_data,
     initialize_sample_data
 )
 from app.config.settings import DATABASE_URL
@@ -69,9 +69,9 @@ def test_migration_system():
     
     # Test 5: Check table data
     logger.info("Test 5: Checking table data...")
+    counts = check_tables_data(required_tables)
     for table in required_tables:
-        count = check_table_data(table)
-        logger.info(f"Table '{table}': {count} rows")
+        logger.info(f"Table '{table}': {counts[table]} rows")
     
     # Test 6: Initialize sample data check
     logger.info("Test 6: Checking sample data...")
@@ -10,15 +10,17 @@ import subprocess
 from pathlib import Path
 
 def run_command(command, description):
-    """Run a command and handle errors."""
+    """Run a command (argument list, no shell) and handle errors.
+    
+    Output is streamed to the console rather than captured.
+    """
     print(f"Running: {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        subprocess.run(command, check=True)
         print(f"SUCCESS: {description} completed")
         return True
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, OSError) as e:
         print(f"ERROR: {description} failed: {e}")
-        print(f"Error output: {e.stderr}")
         return False
 
 def check_python_version():
@@ -56,6 +58,9 @@ HOST=0.0.0.0
 PORT=8000
 DEBUG=true
 LOG_LEVEL=INFO
+
+# CORS (seconds browsers may cache preflight responses)
+CORS_MAX_AGE=86400
 """
     
     try:
@@ -81,21 +86,19 @@ def main():
     venv_path = Path(".venv")
     if not venv_path.exists():
         print("\nCreating virtual environment...")
-        if not run_command("python -m venv .venv", "Creating virtual environment"):
+        if not run_command([sys.executable, "-m", "venv", ".venv"], "Creating virtual environment"):
             sys.exit(1)
     else:
         print("SUCCESS: Virtual environment already exists")
     
     # Activate virtual environment and install dependencies
     if os.name == 'nt':  # Windows
-        pip_cmd = ".venv\\Scripts\\pip"
         python_cmd = ".venv\\Scripts\\python"
     else:  # Unix/Linux/macOS
-        pip_cmd = ".venv/bin/pip"
         python_cmd = ".venv/bin/python"
     
     # Install dependencies
-    if not run_command(f"{pip_cmd} install -r requirements.txt", "Installing dependencies"):
+    if not run_command([python_cmd, "-m", "pip", "install", "-r", "requirements.txt"], "Installing dependencies"):
         sys.exit(1)
     
     # Create .env file
@@ -112,6 +115,8 @@ def main():
     print(f"   {python_cmd} -m app.database.init_db")
     print("\n3. Start the application:")
     print(f"   {python_cmd} -m uvicorn main:app --reload --host 0.0.0.0 --port 8000")
+    print("   In production, set WORKERS in .env and run:")
+    print(f"   {python_cmd} main.py  # migrations run once before the workers start")
     print("\n4. Access the API:")
     print("   - Interactive docs: http://localhost:8000/docs")
     print("   - Health check: http://localhost:8000/api/v1/health")
@@ -0,0 +1,71 @@
+"""
+Shared pytest fixtures.
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.models.base import Base, get_async_db
+from main import app
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    Test client shared by the whole session; the app's lifespan runs once.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+def _enable_foreign_keys(dbapi_connection, connection_record):
+    # SQLite ignores ON DELETE clauses unless foreign keys are switched on
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+@pytest.fixture
+def api_client(tmp_path):
+    """
+    Test client whose requests run against a fresh SQLite database.
+
+    The app's lifespan is not run, so no MySQL server is needed; every test
+    starts from empty tables.
+    """
+    path = tmp_path / "campus.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    engine.dispose()
+
+    # NullPool: connections never outlive the request's event loop
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+    event.listen(async_engine.sync_engine, "connect", _enable_foreign_keys)
+    sessions = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
+    async def get_test_db():
+        async with sessions() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = get_test_db
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_async_db, None)
+
+@pytest.fixture
+def insert_rows(api_client):
+    """
+    Insert ORM rows directly into the api_client database, bypassing the API.
+    """
+    def insert(rows):
+        async def run():
+            sessions = app.dependency_overrides[get_async_db]()
+            db = await sessions.__anext__()
+            db.add_all(rows)
+            await db.commit()
+            await sessions.aclose()
+        asyncio.run(run())
+    return insert
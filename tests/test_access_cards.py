@@ -0,0 +1,130 @@
+"""
+Tests for access card endpoints.
+"""
+
+import pytest
+
+from tests.test_auth import create_user
+
+def create_card(client, user_id, card_number="CARD-001"):
+    """Create an access card through the API and return the raw response."""
+    return client.post("/api/v1/access-cards/", json={"user_id": user_id, "card_number": card_number})
+
+def test_card_revalidated_with_etag(api_client):
+    """
+    Test that card reads carry an ETag, must be revalidated and answer 304 when unchanged.
+    """
+    card = create_card(api_client, create_user(api_client)["id"]).json()
+    url = f"/api/v1/access-cards/{card['id']}"
+
+    response = api_client.get(url)
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "private, no-cache"
+    etag = response.headers["etag"]
+
+    response = api_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert api_client.get(url, headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+
+def test_card_status_change_invalidates_etag(api_client):
+    """
+    Test that a status change is served to clients holding the old ETag.
+    """
+    card = create_card(api_client, create_user(api_client)["id"]).json()
+    url = f"/api/v1/access-cards/{card['id']}"
+    etag = api_client.get(url).headers["etag"]
+
+    assert api_client.put(f"{url}/status", params={"status": "lost"}).status_code == 200
+
+    response = api_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["status"] == "lost"
+    assert response.headers["etag"] != etag
+
+def test_create_card_duplicate_number(api_client):
+    """
+    Test that a duplicate card number is reported as such.
+    """
+    user_id = create_user(api_client)["id"]
+    assert create_card(api_client, user_id).status_code == 201
+
+    response = create_card(api_client, user_id)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Access card with this number already exists"
+
+def test_create_card_for_deleted_user(api_client):
+    """
+    Test that a card cannot be issued to a user deleted after an earlier card.
+    """
+    user_id = create_user(api_client)["id"]
+    assert create_card(api_client, user_id).status_code == 201
+    assert api_client.delete(f"/api/v1/users/{user_id}").status_code == 204
+
+    response = create_card(api_client, user_id, card_number="CARD-002")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "User not found"
+
+def test_create_card_user_deleted_during_request(api_client, monkeypatch):
+    """
+    Test that a foreign key failure on insert is reported as a missing user.
+    """
+    from app.routers import access_cards
+
+    async def exists(db, model, id_):
+        # The user passes the check, then disappears before the insert
+        return True
+
+    monkeypatch.setattr(access_cards, "_exists", exists)
+    response = create_card(api_client, "00000000-0000-0000-0000-000000000000")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "User not found"
+
+@pytest.mark.parametrize("message, status_code", [
+    ("(1062, \"Duplicate entry 'CARD-001' for key 'access_cards.card_number'\")", 400),
+    ("UNIQUE constraint failed: access_cards.card_number", 400),
+    ("(1452, 'Cannot add or update a child row: a foreign key constraint fails "
+     "(`campus_access_db`.`access_cards`, CONSTRAINT `access_cards_ibfk_1` "
+     "FOREIGN KEY (`user_id`) REFERENCES `users` (`id`) ON DELETE CASCADE)')", 404),
+    ("FOREIGN KEY constraint failed", 404),
+])
+def test_create_conflict_mapping(message, status_code):
+    """
+    Test that MySQL and SQLite integrity errors map to the right response.
+    """
+    from sqlalchemy.exc import IntegrityError
+    from app.routers.access_cards import _create_conflict
+
+    error = IntegrityError("INSERT INTO access_cards ...", {}, Exception(message))
+    assert _create_conflict(error).status_code == status_code
+
+def log_access(client, card_id, location="Main Building"):
+    """Record an entry with the given card and return the raw response."""
+    return client.post("/api/v1/access-logs/", json={"card_id": card_id, "location": location, "access_type": "entry"})
+
+def test_delete_card_deletes_its_logs(api_client):
+    """
+    Test that deleting a card removes its access logs and keeps the others.
+    """
+    user_id = create_user(api_client)["id"]
+    card = create_card(api_client, user_id).json()
+    other_card = create_card(api_client, user_id, card_number="CARD-002").json()
+    assert log_access(api_client, card["id"]).status_code == 201
+    assert log_access(api_client, other_card["id"]).status_code == 201
+
+    assert api_client.delete(f"/api/v1/access-cards/{card['id']}").status_code == 204
+
+    logs = api_client.get("/api/v1/access-logs/").json()["items"]
+    assert [log["card_id"] for log in logs] == [other_card["id"]]
+
+def test_delete_user_deletes_card_logs(api_client):
+    """
+    Test that deleting a user removes the access logs of their cards.
+    """
+    user_id = create_user(api_client)["id"]
+    card = create_card(api_client, user_id).json()
+    assert log_access(api_client, card["id"]).status_code == 201
+
+    assert api_client.delete(f"/api/v1/users/{user_id}").status_code == 204
+
+    assert api_client.get("/api/v1/access-logs/").json()["items"] == []
@@ -0,0 +1,131 @@
+"""
+Tests for access log endpoints.
+"""
+
+import base64
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.models.database_models import AccessLog
+from app.routers.access_logs import _decode_cursor, _encode_cursor
+from tests.test_access_cards import create_card, log_access
+from tests.test_auth import create_user
+
+def fetch_all_pages(client, url, limit):
+    """Follow next_cursor until the last page and return every log, in order."""
+    items, cursor = [], None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        page = client.get(url, params=params).json()
+        items.extend(page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return items
+
+def test_cursor_round_trip():
+    """
+    Test that a cursor decodes back to the position it was made from.
+    """
+    log = SimpleNamespace(accessed_at=datetime(2024, 1, 15, 9, 30, 0, 123456), id=str(uuid.uuid4()))
+    assert _decode_cursor(_encode_cursor(log)) == (log.accessed_at, log.id)
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    base64.urlsafe_b64encode(b"no separator").decode(),
+    base64.urlsafe_b64encode(b"yesterday|abc").decode(),
+    base64.urlsafe_b64encode(b"\xff\xfe|\xfd").decode(),
+])
+def test_malformed_cursor_rejected(api_client, cursor):
+    """
+    Test that a malformed cursor is answered with a 400.
+    """
+    response = api_client.get("/api/v1/access-logs/", params={"cursor": cursor})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+def test_pages_stable_on_timestamp_ties(api_client, insert_rows):
+    """
+    Test that paging visits every log once, newest first, when many share a timestamp.
+    """
+    tied_at = datetime(2024, 1, 15, 9, 0, 0)
+    logs = [
+        AccessLog(accessed_at=tied_at, location="Main Building", access_type="entry")
+        for _ in range(5)
+    ]
+    logs.append(AccessLog(accessed_at=tied_at + timedelta(hours=1), location="Library", access_type="entry"))
+    logs.append(AccessLog(accessed_at=tied_at - timedelta(hours=1), location="Library", access_type="exit"))
+    insert_rows(logs)
+
+    items = fetch_all_pages(api_client, "/api/v1/access-logs/", limit=2)
+
+    expected = sorted(logs, key=lambda log: (log.accessed_at, log.id), reverse=True)
+    assert [item["id"] for item in items] == [log.id for log in expected]
+
+def test_location_pages_filtered(api_client, insert_rows):
+    """
+    Test that location paging only returns logs for that location.
+    """
+    tied_at = datetime(2024, 1, 15, 9, 0, 0)
+    insert_rows([
+        AccessLog(accessed_at=tied_at, location=location, access_type="entry")
+        for location in ("Library", "Library", "Library", "Main Building")
+    ])
+
+    items = fetch_all_pages(api_client, "/api/v1/access-logs/location/Library", limit=2)
+    assert len(items) == 3
+    assert {item["location"] for item in items} == {"Library"}
+
+def test_create_log_for_unknown_card(api_client):
+    """
+    Test that a log for an unknown card is rejected and nothing is recorded.
+    """
+    response = log_access(api_client, str(uuid.uuid4()))
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Access card not found"
+    assert api_client.get("/api/v1/access-logs/").json()["items"] == []
+
+def test_create_log_for_card(api_client):
+    """
+    Test that a log for an existing card is recorded against it.
+    """
+    card = create_card(api_client, create_user(api_client)["id"]).json()
+    response = log_access(api_client, card["id"])
+    assert response.status_code == 201
+    assert response.json()["card_id"] == card["id"]
+    assert response.json()["access_type"] == "entry"
+
+def simulate(client, card_number="CARD-001"):
+    """Simulate an entry with the given card number and return the raw response."""
+    return client.post("/api/v1/access-logs/simulate-access", params={
+        "card_number": card_number, "location": "Main Building", "access_type": "entry"
+    })
+
+def test_simulate_access_active_card(api_client):
+    """
+    Test that an active card is logged with the requested access type.
+    """
+    create_card(api_client, create_user(api_client)["id"])
+    response = simulate(api_client)
+    assert response.status_code == 201
+    assert response.json()["access_type"] == "entry"
+
+def test_simulate_access_lost_card_denied(api_client):
+    """
+    Test that a card that is not active is logged as denied.
+    """
+    card = create_card(api_client, create_user(api_client)["id"]).json()
+    api_client.put(f"/api/v1/access-cards/{card['id']}/status", params={"status": "lost"})
+    response = simulate(api_client)
+    assert response.status_code == 201
+    assert response.json()["access_type"] == "denied"
+
+def test_simulate_access_unknown_card(api_client):
+    """
+    Test that simulating with an unknown card number returns 404.
+    """
+    response = simulate(api_client, card_number="UNKNOWN")
+    assert response.status_code == 404
+    assert api_client.get("/api/v1/access-logs/").json()["items"] == []
@@ -0,0 +1,130 @@
+"""
+Tests for authentication endpoints.
+"""
+
+PASSWORD = "password123"
+
+def create_user(client, email="user@campus.com", role="student"):
+    """Create a user through the API and return its JSON representation."""
+    response = client.post("/api/v1/users/", json={"email": email, "role": role, "password": PASSWORD})
+    assert response.status_code == 201
+    return response.json()
+
+def login(client, email="user@campus.com", password=PASSWORD):
+    """Log in and return the raw response."""
+    return client.post("/api/v1/auth/login", data={"username": email, "password": password})
+
+def auth_headers(client, email="user@campus.com", password=PASSWORD):
+    """Log in and return the bearer header for the issued token."""
+    response = login(client, email, password)
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+def test_me_returns_current_user(api_client):
+    """
+    Test that a valid token resolves to its user.
+    """
+    user = create_user(api_client)
+    response = api_client.get("/api/v1/auth/me", headers=auth_headers(api_client))
+    assert response.status_code == 200
+    assert response.json()["id"] == user["id"]
+
+def test_deleted_user_token_rejected(api_client):
+    """
+    Test that a token stops working as soon as its user is deleted.
+    """
+    user = create_user(api_client)
+    headers = auth_headers(api_client)
+    assert api_client.get("/api/v1/auth/me", headers=headers).status_code == 200
+
+    assert api_client.delete(f"/api/v1/users/{user['id']}").status_code == 204
+    assert api_client.get("/api/v1/auth/me", headers=headers).status_code == 401
+
+def test_role_change_visible_to_existing_token(api_client):
+    """
+    Test that a role change is reflected for tokens issued before it.
+    """
+    user = create_user(api_client)
+    headers = auth_headers(api_client)
+    assert api_client.get("/api/v1/auth/me", headers=headers).json()["role"] == "student"
+
+    response = api_client.put(f"/api/v1/users/{user['id']}", json={"role": "professor"})
+    assert response.status_code == 200
+    assert api_client.get("/api/v1/auth/me", headers=headers).json()["role"] == "professor"
+
+def test_logout_revokes_token(api_client):
+    """
+    Test that a token is rejected after logout while other tokens keep working.
+    """
+    create_user(api_client)
+    create_user(api_client, email="other@campus.com")
+    headers = auth_headers(api_client)
+    other_headers = auth_headers(api_client, email="other@campus.com")
+
+    assert api_client.post("/api/v1/auth/logout", headers=headers).status_code == 200
+    assert api_client.get("/api/v1/auth/me", headers=headers).status_code == 401
+    assert api_client.post("/api/v1/auth/logout", headers=headers).status_code == 401
+    assert api_client.get("/api/v1/auth/me", headers=other_headers).status_code == 200
+
+def test_login_returns_current_profile(api_client):
+    """
+    Test that login reflects profile changes made since the previous login.
+    """
+    user = create_user(api_client)
+    response = api_client.post("/api/v1/students/", json={
+        "user_id": user["id"],
+        "full_name": "Jean Dupont",
+        "student_card_id": "STU-001",
+        "email": "jean.dupont@campus.com",
+        "class_name": "B3"
+    })
+    assert response.status_code == 201
+    student_id = response.json()["id"]
+    assert login(api_client).json()["profile"]["full_name"] == "Jean Dupont"
+
+    response = api_client.put(f"/api/v1/students/{student_id}", json={"full_name": "Jean Martin"})
+    assert response.status_code == 200
+    assert login(api_client).json()["profile"]["full_name"] == "Jean Martin"
+
+def test_login_with_non_bcrypt_hash(api_client, insert_rows):
+    """
+    Test that a stored hash that is not bcrypt fails the login instead of erroring.
+    """
+    from app.models.database_models import User
+
+    insert_rows([User(email="legacy@campus.com", password_hash=PASSWORD, role="student")])
+    assert login(api_client, email="legacy@campus.com").status_code == 401
+
+def test_token_decoded_once(api_client, monkeypatch):
+    """
+    Test that a token's signature is checked on first use only, while the
+    user is still read on every request.
+    """
+    from app.routers import authentication
+
+    user_id = create_user(api_client)["id"]
+    headers = auth_headers(api_client)
+    decoded = []
+    decode = authentication.jwt.decode
+    monkeypatch.setattr(authentication.jwt, "decode", lambda *args, **kwargs: decoded.append(1) or decode(*args, **kwargs))
+
+    authentication._decoded_tokens.clear()
+    assert api_client.get("/api/v1/auth/me", headers=headers).status_code == 200
+    assert api_client.get("/api/v1/auth/me", headers=headers).status_code == 200
+    assert len(decoded) == 1
+
+    assert api_client.delete(f"/api/v1/users/{user_id}", headers=headers).status_code == 204
+    assert api_client.get("/api/v1/auth/me", headers=headers).status_code == 401
+
+def test_expired_token_rejected(api_client):
+    """
+    Test that an expired token is rejected and not kept in the payload cache.
+    """
+    from datetime import timedelta
+    from app.routers import authentication
+
+    create_user(api_client)
+    token = authentication.create_access_token({"sub": "user@campus.com"}, expires_delta=timedelta(seconds=-1))
+    response = api_client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 401
+    assert token not in authentication._decoded_tokens
@@ -2,14 +2,11 @@
 Tests for health check endpoints.
 """
 
-import pytest
-from fastapi.testclient import TestClient
-from main import app
+import os
+import subprocess
+import sys
 
-# Create test client
-client = TestClient(app)
-
-def test_health_check():
+def test_health_check(client):
     """
     Test basic health check endpoint.
     """
@@ -22,7 +19,7 @@ def test_health_check():
     assert data["service"] == "Campus Access Management System"
     assert data["version"] == "1.0.0"
 
-def test_detailed_health_check():
+def test_detailed_health_check(client):
     """
     Test detailed health check endpoint.
     """
@@ -39,7 +36,7 @@ def test_detailed_health_check():
     assert "python_version" in environment
     assert "platform" in environment
 
-def test_readiness_check():
+def test_readiness_check(client):
     """
     Test readiness check endpoint.
     """
@@ -50,7 +47,18 @@ def test_readiness_check():
     assert data["status"] == "ready"
     assert "timestamp" in data
 
-def test_root_endpoint():
+def test_cors_preflight_max_age(client):
+    """
+    Test that CORS preflight responses can be cached by browsers.
+    """
+    response = client.options(
+        "/api/v1/users",
+        headers={"Origin": "http://example.com", "Access-Control-Request-Method": "POST"}
+    )
+    assert response.status_code == 200
+    assert response.headers["access-control-max-age"] == "86400"
+
+def test_root_endpoint(client):
     """
     Test root endpoint.
     """
@@ -61,4 +69,19 @@ def test_root_endpoint():
     assert "message" in data
     assert "docs" in data
     assert "redoc" in data
-    assert "health" in data 
\ No newline at end of file
+    assert "health" in data
+    assert client.get(data["docs"]).status_code == 200
+
+def test_root_endpoint_without_docs_in_prod():
+    """
+    Test that the root endpoint does not link to docs when they are disabled.
+    """
+    code = (
+        "from fastapi.testclient import TestClient\n"
+        "from main import app\n"
+        "client = TestClient(app)\n"
+        "data = client.get('/').json()\n"
+        "assert 'docs' not in data and 'redoc' not in data, data\n"
+        "assert client.get('/docs').status_code == 404\n"
+    )
+    subprocess.run([sys.executable, "-c", code], env={**os.environ, "ENV": "prod"}, check=True)
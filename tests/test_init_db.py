@@ -0,0 +1,39 @@
+"""
+Tests for the database initialization script.
+"""
+
+import dataclasses
+from pathlib import Path
+
+import bcrypt
+import pytest
+
+from app.config.settings import get_settings
+from app.database import init_db
+
+def use_settings(monkeypatch, **changes):
+    """Make init_db see settings with the given fields replaced."""
+    settings = dataclasses.replace(get_settings(), **changes)
+    monkeypatch.setattr(init_db, "get_settings", lambda: settings)
+
+def test_admin_hash_from_settings(monkeypatch):
+    """
+    Test that a configured ADMIN_PASSWORD_HASH is used as is.
+    """
+    use_settings(monkeypatch, admin_password_hash="$2b$12$precomputed")
+    assert init_db._admin_password_hash() == "$2b$12$precomputed"
+
+@pytest.mark.parametrize("environment, rounds", [("dev", 10), ("prod", 12)])
+def test_admin_hash_computed_per_environment(monkeypatch, environment, rounds):
+    """
+    Test that the admin hash is computed at the environment's cost and not written to disk.
+    """
+    use_settings(monkeypatch, admin_password_hash=None, environment=environment)
+    project_root = Path(init_db.__file__).resolve().parents[2]
+    files_before = set(project_root.iterdir())
+
+    hashed = init_db._admin_password_hash()
+
+    assert hashed.startswith(f"$2b${rounds:02d}$")
+    assert bcrypt.checkpw(b"admin123", hashed.encode())
+    assert set(project_root.iterdir()) == files_before
@@ -2,7 +2,6 @@
 Test cases for database migration system.
 """
 
-import pytest
 from app.database.migrations import (
     check_database_connection,
     get_existing_tables,
@@ -74,4 +73,26 @@ def test_migration_idempotency():
     tables_after_first = get_existing_tables()
     tables_after_second = get_existing_tables()
     
-    assert tables_after_first == tables_after_second, "Table structure should be consistent" 
\ No newline at end of file
+    assert tables_after_first == tables_after_second, "Table structure should be consistent" 
+
+def test_existing_tables_cached_until_forced(monkeypatch):
+    """Test that table names are cached until a forced lookup."""
+    from app.database import migrations
+
+    class FakeInspector:
+        calls = 0
+        tables = ['users']
+
+        def get_table_names(self):
+            FakeInspector.calls += 1
+            return list(self.tables)
+
+    monkeypatch.setattr(migrations, "_TABLES_CACHE", None)
+    monkeypatch.setattr(migrations, "inspect", lambda bind: FakeInspector())
+
+    assert get_existing_tables() == ['users']
+    FakeInspector.tables = ['users', 'rooms']
+    assert get_existing_tables() == ['users'], "Cached names should be returned without a query"
+    assert get_existing_tables(force=True) == ['users', 'rooms']
+    assert get_existing_tables() == ['users', 'rooms']
+    assert FakeInspector.calls == 2
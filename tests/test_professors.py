@@ -0,0 +1,67 @@
+"""
+Tests for professor endpoints.
+"""
+
+from tests.test_auth import create_user
+
+def test_list_and_stats_reflect_writes(api_client):
+    """
+    Test that list pages and stats show updates and the owner's deletion immediately.
+    """
+    user = create_user(api_client, role="professor")
+    response = api_client.post("/api/v1/professors/", json={
+        "user_id": user["id"],
+        "full_name": "Marie Curie",
+        "email": "marie.curie@campus.com",
+        "department": "Physics"
+    })
+    assert response.status_code == 201
+    professor_id = response.json()["id"]
+    assert api_client.get("/api/v1/professors/stats/summary").json()["unique_departments"] == 1
+
+    api_client.put(f"/api/v1/professors/{professor_id}", json={"department": "Chemistry"})
+    assert api_client.get("/api/v1/professors/").json()["items"][0]["department"] == "Chemistry"
+
+    # Deleting the user cascades to the profile
+    assert api_client.delete(f"/api/v1/users/{user['id']}").status_code == 204
+    assert api_client.get("/api/v1/professors/").json()["total"] == 0
+    assert api_client.get("/api/v1/professors/stats/summary").json()["total_professors"] == 0
+
+def test_department_list_revalidated_with_etag(api_client):
+    """
+    Test that an unchanged department page answers 304 and a changed one a new body.
+    """
+    user = create_user(api_client, role="professor")
+    professor = api_client.post("/api/v1/professors/", json={
+        "user_id": user["id"],
+        "full_name": "Marie Curie",
+        "email": "marie.curie@campus.com",
+        "department": "Physics"
+    }).json()
+    url = "/api/v1/professors/department/Physics"
+    etag = api_client.get(url).headers["etag"]
+    assert api_client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    api_client.put(f"/api/v1/professors/{professor['id']}", json={"full_name": "Marie Sklodowska-Curie"})
+    response = api_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["items"][0]["full_name"] == "Marie Sklodowska-Curie"
+
+def test_create_professor_user_deleted_during_request(api_client, monkeypatch):
+    """
+    Test that a foreign key failure on insert is reported as a missing user,
+    not as an existing profile.
+    """
+    from sqlalchemy import false, literal, select
+    from app.routers import professors
+
+    # The user passes the check, then disappears before the insert
+    monkeypatch.setattr(professors, "_CREATE_CHECKS", select(literal(1).label("id"), false().label("has_profile")))
+    response = api_client.post("/api/v1/professors/", json={
+        "user_id": "00000000-0000-0000-0000-000000000000",
+        "full_name": "Marie Curie",
+        "email": "marie.curie@campus.com",
+        "department": "Physics"
+    })
+    assert response.status_code == 404
+    assert response.json()["detail"] == "User not found"
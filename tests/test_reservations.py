@@ -0,0 +1,81 @@
+"""
+Tests for room reservation endpoints.
+"""
+
+import uuid
+
+import pytest
+
+from tests.test_auth import create_user
+
+START = "2030-01-16T10:00:00"
+END = "2030-01-16T11:00:00"
+
+@pytest.fixture
+def room_and_user(api_client):
+    """Create a room of capacity 10 and a user; return their IDs."""
+    response = api_client.post("/api/v1/rooms/", json={"name": "B101", "location": "Main Building", "capacity": 10})
+    assert response.status_code == 201
+    return response.json()["id"], create_user(api_client)["id"]
+
+def reserve(client, room_id, user_id, start=START, end=END, occupants=5):
+    """Request a reservation and return the raw response."""
+    return client.post("/api/v1/reservations/", json={
+        "room_id": room_id,
+        "reserved_by": user_id,
+        "start_time": start,
+        "end_time": end,
+        "expected_occupants": occupants
+    })
+
+def test_create_reservation(api_client, room_and_user):
+    """
+    Test that a valid reservation is created.
+    """
+    room_id, user_id = room_and_user
+    response = reserve(api_client, room_id, user_id)
+    assert response.status_code == 201
+    assert response.json()["room_id"] == room_id
+    assert response.json()["reserved_by"] == user_id
+
+def test_reservation_unknown_room(api_client, room_and_user):
+    """
+    Test that a reservation for an unknown room is rejected with 404.
+    """
+    _, user_id = room_and_user
+    response = reserve(api_client, str(uuid.uuid4()), user_id)
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Room not found"
+
+def test_reservation_unknown_user(api_client, room_and_user):
+    """
+    Test that a reservation by an unknown user is rejected with 404.
+    """
+    room_id, _ = room_and_user
+    response = reserve(api_client, room_id, str(uuid.uuid4()))
+    assert response.status_code == 404
+    assert response.json()["detail"] == "User not found"
+
+def test_reservation_over_capacity(api_client, room_and_user):
+    """
+    Test that a reservation exceeding the room capacity is rejected with 400.
+    """
+    room_id, user_id = room_and_user
+    response = reserve(api_client, room_id, user_id, occupants=11)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Expected occupants (11) exceed room capacity (10)"
+
+def test_reservation_time_conflict(api_client, room_and_user):
+    """
+    Test that an overlapping reservation is rejected while an adjacent one is accepted.
+    """
+    room_id, user_id = room_and_user
+    assert reserve(api_client, room_id, user_id).status_code == 201
+
+    response = reserve(api_client, room_id, user_id, start="2030-01-16T10:30:00", end="2030-01-16T11:30:00")
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Time conflict: Room is already reserved for this time period"
+
+    # Slots are half-open, so back-to-back bookings do not overlap
+    assert reserve(api_client, room_id, user_id, start=END, end="2030-01-16T12:00:00").status_code == 201
+    assert api_client.get("/api/v1/reservations/").json()["total"] == 2
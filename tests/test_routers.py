@@ -0,0 +1,54 @@
+"""
+Tests for the routers package.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from app.routers import _ROUTES
+
+# Routers other modules may depend on: users needs the auth dependency
+SHARED_ROUTERS = {"authentication"}
+# Helper modules shared by every router, not routers themselves
+SHARED_HELPERS = {"_http"}
+
+@pytest.mark.parametrize("name", [name for name, _, _ in _ROUTES])
+def test_router_imports_no_other_routers(name):
+    """
+    Test that importing one router does not import the others.
+    """
+    code = (
+        "import sys\n"
+        f"import app.routers.{name}\n"
+        "print(' '.join(sorted(m.rsplit('.', 1)[1] for m in sys.modules if m.startswith('app.routers.'))))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.split()
+    assert set(output) - SHARED_ROUTERS - SHARED_HELPERS - {name} == set()
+
+@pytest.mark.parametrize("method, url", [
+    ("GET", "/api/v1/users/not-a-uuid"),
+    ("PUT", "/api/v1/users/not-a-uuid"),
+    ("DELETE", "/api/v1/users/not-a-uuid"),
+    ("GET", "/api/v1/access-cards/not-a-uuid"),
+    ("GET", "/api/v1/access-logs/not-a-uuid"),
+    ("GET", "/api/v1/access-logs/card/not-a-uuid"),
+    ("GET", "/api/v1/access-logs/user/not-a-uuid"),
+    ("GET", "/api/v1/rooms/not-a-uuid"),
+    ("GET", "/api/v1/reservations/not-a-uuid"),
+    ("GET", "/api/v1/students/not-a-uuid"),
+    ("GET", "/api/v1/students/user/not-a-uuid"),
+    ("DELETE", "/api/v1/students/not-a-uuid"),
+    ("GET", "/api/v1/professors/not-a-uuid"),
+    ("GET", "/api/v1/professors/user/not-a-uuid"),
+    ("DELETE", "/api/v1/professors/not-a-uuid"),
+])
+def test_malformed_id_rejected(api_client, method, url):
+    """
+    Test that every router answers a malformed ID path parameter with 422.
+    """
+    response = api_client.request(method, url, json={})
+    assert response.status_code == 422
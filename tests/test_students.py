@@ -0,0 +1,72 @@
+"""
+Tests for student endpoints.
+"""
+
+import pytest
+
+from tests.test_auth import create_user
+
+def create_student(client, user_id, class_name="B3"):
+    """Create a student profile through the API and return its JSON representation."""
+    response = client.post("/api/v1/students/", json={
+        "user_id": user_id,
+        "full_name": "Jean Dupont",
+        "student_card_id": "STU-001",
+        "email": "jean.dupont@campus.com",
+        "class_name": class_name
+    })
+    assert response.status_code == 201
+    return response.json()
+
+def test_list_and_stats_reflect_writes(api_client):
+    """
+    Test that list pages and stats show updates and deletions immediately.
+    """
+    student = create_student(api_client, create_user(api_client)["id"])
+    assert api_client.get("/api/v1/students/stats/summary").json()["class_distribution"] == [
+        {"class_name": "B3", "count": 1}
+    ]
+
+    api_client.put(f"/api/v1/students/{student['id']}", json={"class_name": "M1"})
+    assert api_client.get("/api/v1/students/").json()["items"][0]["class_name"] == "M1"
+    assert api_client.get("/api/v1/students/stats/summary").json()["class_distribution"] == [
+        {"class_name": "M1", "count": 1}
+    ]
+
+    assert api_client.delete(f"/api/v1/students/{student['id']}").status_code == 204
+    assert api_client.get("/api/v1/students/").json()["total"] == 0
+    assert api_client.get("/api/v1/students/stats/summary").json()["total_students"] == 0
+
+@pytest.mark.parametrize("url", ["/api/v1/students/", "/api/v1/students/class/B3"])
+def test_list_revalidated_with_etag(api_client, url):
+    """
+    Test that an unchanged list page answers 304 and a changed one a new body.
+    """
+    student = create_student(api_client, create_user(api_client)["id"])
+    etag = api_client.get(url).headers["etag"]
+    assert api_client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    api_client.put(f"/api/v1/students/{student['id']}", json={"full_name": "Jean Martin"})
+    response = api_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["items"][0]["full_name"] == "Jean Martin"
+
+def test_create_student_user_deleted_during_request(api_client, monkeypatch):
+    """
+    Test that a foreign key failure on insert is reported as a missing user,
+    not as an existing profile.
+    """
+    from sqlalchemy import false, literal, select
+    from app.routers import students
+
+    # The user passes the check, then disappears before the insert
+    monkeypatch.setattr(students, "_CREATE_CHECKS", select(literal(1).label("id"), false().label("has_profile")))
+    response = api_client.post("/api/v1/students/", json={
+        "user_id": "00000000-0000-0000-0000-000000000000",
+        "full_name": "Jean Dupont",
+        "student_card_id": "STU-001",
+        "email": "jean.dupont@campus.com",
+        "class_name": "B3"
+    })
+    assert response.status_code == 404
+    assert response.json()["detail"] == "User not found"
@@ -0,0 +1,44 @@
+"""
+Tests for the timestamps recorded on created rows.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from tests.test_access_cards import create_card, log_access
+from tests.test_auth import create_user
+
+@pytest.fixture
+def non_utc_local_time(monkeypatch):
+    """Run the test with a local time zone far from UTC."""
+    monkeypatch.setenv("TZ", "Asia/Tokyo")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+def assert_utc_now(value):
+    """Check that an ISO timestamp is the current UTC time, give or take a minute."""
+    stored = datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+    assert abs(stored - datetime.now(timezone.utc)) < timedelta(minutes=1)
+
+def test_timestamps_are_utc(api_client, non_utc_local_time):
+    """
+    Test that cards, access logs and student profiles are stamped in UTC,
+    whatever the server's local time zone.
+    """
+    user_id = create_user(api_client)["id"]
+    card = create_card(api_client, user_id).json()
+    assert_utc_now(card["issued_at"])
+    assert_utc_now(log_access(api_client, card["id"]).json()["accessed_at"])
+
+    response = api_client.post("/api/v1/students/", json={
+        "user_id": user_id,
+        "full_name": "Jean Dupont",
+        "student_card_id": "STU-001",
+        "email": "jean.dupont@campus.com",
+        "class_name": "B3"
+    })
+    assert_utc_now(response.json()["registered_at"])
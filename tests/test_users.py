@@ -0,0 +1,89 @@
+"""
+Tests for user endpoints.
+"""
+
+import uuid
+
+from tests.test_auth import auth_headers, create_user, login
+
+NEW_PASSWORD = "new-password456"
+
+def test_change_own_password(api_client):
+    """
+    Test that users can change their own password and log in with it.
+    """
+    user = create_user(api_client)
+    headers = auth_headers(api_client)
+
+    response = api_client.patch(
+        f"/api/v1/users/{user['id']}/password", json={"password": NEW_PASSWORD}, headers=headers
+    )
+    assert response.status_code == 204
+
+    assert login(api_client).status_code == 401
+    assert login(api_client, password=NEW_PASSWORD).status_code == 200
+
+def test_change_password_rejects_old_tokens(api_client):
+    """
+    Test that tokens issued before a password change stop working.
+    """
+    user = create_user(api_client)
+    headers = auth_headers(api_client)
+
+    api_client.patch(f"/api/v1/users/{user['id']}/password", json={"password": NEW_PASSWORD}, headers=headers)
+
+    assert api_client.get("/api/v1/auth/me", headers=headers).status_code == 401
+    new_headers = auth_headers(api_client, password=NEW_PASSWORD)
+    assert api_client.get("/api/v1/auth/me", headers=new_headers).status_code == 200
+
+def test_change_password_requires_authentication(api_client):
+    """
+    Test that changing a password without a token is rejected.
+    """
+    user = create_user(api_client)
+    response = api_client.patch(f"/api/v1/users/{user['id']}/password", json={"password": NEW_PASSWORD})
+    assert response.status_code == 401
+    assert login(api_client).status_code == 200
+
+def test_change_other_users_password_forbidden(api_client):
+    """
+    Test that non-admin users cannot change someone else's password.
+    """
+    victim = create_user(api_client, email="victim@campus.com")
+    create_user(api_client)
+
+    response = api_client.patch(
+        f"/api/v1/users/{victim['id']}/password",
+        json={"password": NEW_PASSWORD},
+        headers=auth_headers(api_client)
+    )
+    assert response.status_code == 403
+    assert login(api_client, email="victim@campus.com").status_code == 200
+
+def test_admin_changes_password(api_client):
+    """
+    Test that admins can change other users' passwords.
+    """
+    user = create_user(api_client)
+    create_user(api_client, email="admin@campus.com", role="admin")
+
+    response = api_client.patch(
+        f"/api/v1/users/{user['id']}/password",
+        json={"password": NEW_PASSWORD},
+        headers=auth_headers(api_client, email="admin@campus.com")
+    )
+    assert response.status_code == 204
+    assert login(api_client, password=NEW_PASSWORD).status_code == 200
+
+def test_change_password_unknown_user(api_client):
+    """
+    Test that changing the password of an unknown user returns 404.
+    """
+    create_user(api_client, email="admin@campus.com", role="admin")
+
+    response = api_client.patch(
+        f"/api/v1/users/{uuid.uuid4()}/password",
+        json={"password": NEW_PASSWORD},
+        headers=auth_headers(api_client, email="admin@campus.com")
+    )
+    assert response.status_code == 404